@@ -145,17 +145,13 @@ async def _run_queue_resolution(agent, db, config: dict) -> int:
     print(f"[ONT-MAINT] Processing {len(batch)} pending candidates", flush=True)
 
     try:
-        # Import resolution engine (installed at /a0/usr/ontology/)
-        sys.path.insert(0, ONTOLOGY_DIR)
+        # Import resolution engine (installed at /a0/usr/ontology/) by
+        # module name: score_pairs' pool workers pickle its functions by
+        # reference, which needs the sys.modules entry
+        if ONTOLOGY_DIR not in sys.path:
+            sys.path.insert(0, ONTOLOGY_DIR)
         import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "resolution_engine",
-            os.path.join(ONTOLOGY_DIR, "resolution_engine.py")
-        )
-        if spec is None:
-            return 0
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = importlib.import_module("resolution_engine")
 
         result = module.resolve_batch(batch, config)
         resolved_entities = result.get('resolved', []) + result.get('distinct', [])
@@ -169,18 +165,14 @@ async def _run_queue_resolution(agent, db, config: dict) -> int:
             store_module = importlib.util.module_from_spec(spec2)
             spec2.loader.exec_module(store_module)
 
-            stored = 0
-            for entity in resolved_entities:
-                try:
-                    entity_id = await store_module.store_entity(agent, entity)
-                    if entity_id:
-                        stored += 1
-                except Exception as e:
-                    print(f"[ONT-MAINT] Store failed: {e}", flush=True)
+            try:
+                stored = len(await store_module.store_entities_bulk(agent, resolved_entities))
+            except Exception as e:
+                print(f"[ONT-MAINT] Store failed: {e}", flush=True)
+                stored = 0
 
             # Mark queue entries as resolved
-            candidate_ids = {module._candidate_id(c) for c in batch}
-            module.mark_queue_resolved(candidate_ids)
+            module.mark_queue_resolved(result['candidate_ids'])
 
             return stored
 
@@ -272,4 +272,5 @@ def _append_to_queue(candidates: list):
     os.makedirs(ONTOLOGY_DIR, exist_ok=True)
     with open(INGESTION_QUEUE, 'a', encoding='utf-8') as f:
         for cand in candidates:
-            f.write(json.dumps(cand) + '\n')
+            # Explicit false flag is patched in place by mark_queue_resolved
+            f.write(json.dumps({**cand, "_resolved": False}) + '\n')
@@ -85,7 +85,41 @@ def ingest_html(
 
     # Strip HTML if needed
     text = _strip_html(content) if is_html else content
+    return _ingest_text(text, source_id, source_url, min_name_length, max_candidates)
 
+
+def ingest_html_file(
+    file_path: str,
+    source_id: str,
+    source_url: str = "",
+    is_html: bool = True,
+    min_name_length: int = 4,
+    max_candidates: int = 200,
+) -> dict:
+    """ingest_html for a file on disk.
+
+    HTML is read and tag-stripped in chunks, so the raw markup is never
+    held as one string — only the (much smaller) extracted text is.
+    Plain text is read whole: extraction needs the full text anyway.
+    """
+    print(f"[ONT-INGEST] html_connector: extracting from source_id={source_id}", flush=True)
+
+    if is_html:
+        text = _strip_html_file(file_path)
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    return _ingest_text(text, source_id, source_url, min_name_length, max_candidates)
+
+
+def _ingest_text(
+    text: str,
+    source_id: str,
+    source_url: str,
+    min_name_length: int,
+    max_candidates: int,
+) -> dict:
+    """Extract candidates from already-stripped text and queue them."""
     # Extract entities by type
     names = _extract_names(text, min_name_length)
     dates = _extract_dates(text)
@@ -184,6 +218,53 @@ def _strip_html(content: str) -> str:
     return _WHITESPACE.sub(' ', text).strip()
 
 
+_READ_CHUNK = 1 << 20  # chars per read in _strip_html_file
+
+# Characters that end any character reference html.unescape recognizes
+_REF_END = re.compile(r'[\t\n\f ]')
+
+
+def _strip_html_file(file_path: str) -> str:
+    """_strip_html over a file, reading it in chunks.
+
+    Equivalent to _strip_html(open(file_path).read()): a chunk's tail is
+    carried into the next read whenever it might still be part of a tag
+    (an unclosed '<') or of a character reference (a trailing '&...').
+    """
+    pieces = []
+    pending_html = ""   # raw markup not yet safe to strip
+    pending_text = ""   # stripped text not yet safe to unescape
+    with open(file_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(_READ_CHUNK)
+            buf = pending_html + chunk
+            if chunk:
+                # Hold back from the first '<' that has no '>' after it
+                cut = buf.find('<', buf.rfind('>') + 1)
+                if cut == -1:
+                    cut = len(buf)
+                buf, pending_html = buf[:cut], buf[cut:]
+            else:
+                pending_html = ""
+
+            text = pending_text + _HTML_TAG.sub(' ', buf)
+            if chunk:
+                # References never span '&' or whitespace, so only a last
+                # '&' with no whitespace after it can still be incomplete
+                amp = text.rfind('&')
+                if amp == -1 or _REF_END.search(text, amp):
+                    amp = len(text)
+                text, pending_text = text[:amp], text[amp:]
+            else:
+                pending_text = ""
+            pieces.append(html.unescape(text))
+
+            if not chunk:
+                break
+
+    return _WHITESPACE.sub(' ', "".join(pieces)).strip()
+
+
 def _extract_names(text: str, min_length: int = 4) -> list:
     """Extract capitalized proper-noun sequences as candidate names.
 
@@ -259,4 +340,5 @@ def _append_to_queue(candidates: list):
     os.makedirs(ONTOLOGY_DIR, exist_ok=True)
     with open(INGESTION_QUEUE, 'a', encoding='utf-8') as f:
         for cand in candidates:
-            f.write(json.dumps(cand) + '\n')
+            # Explicit false flag is patched in place by mark_queue_resolved
+            f.write(json.dumps({**cand, "_resolved": False}) + '\n')
@@ -12,6 +12,12 @@ Entities are stored with area="ontology" and extended metadata including:
 Relationships are stored as typed, directional edges in a JSONL file.
 
 No external dependencies. FAISS access goes through Agent-Zero's Memory API.
+This module never handles vectors: embedding, normalization and the index
+itself belong to Memory. Every write (store_entity, store_entities_bulk)
+goes through Memory.insert_text/insert_documents and every read through
+Memory.search_similarity_threshold. That keeps entity vectors in the same
+space as the query vectors Memory produces, so search_entities' threshold
+is the memory store's own similarity score.
 """
 
 import hashlib
@@ -116,16 +122,14 @@ def build_entity_summary(entity: dict, relationships: list = None) -> str:
 # Entity Storage (FAISS via Memory API)
 # ═════════════════════════════════════════════════════════════════════════════
 
-async def store_entity(agent, entity: dict, entity_id: str = None) -> str:
-    """Store resolved entity as classified memory in FAISS.
+def _build_entity_memory(
+    entity: dict, entity_id: str = None, existing_rels: list = None,
+) -> tuple:
+    """Build (entity_id, summary, metadata) for an entity memory.
 
-    Returns entity_id.
+    existing_rels: relationships to fold into the summary; looked up from
+    relationships.jsonl when None.
     """
-    try:
-        from python.helpers.memory import Memory
-    except ImportError:
-        return ""
-
     props = entity.get('properties', {})
     entity_type = entity.get('entity_type', 'entity')
     name = props.get('name', 'Unknown')
@@ -135,7 +139,8 @@ async def store_entity(agent, entity: dict, entity_id: str = None) -> str:
         entity_id = generate_entity_id(entity_type, name, provenance)
 
     # Load existing relationships for this entity to include in summary
-    existing_rels = get_entity_relationships(entity_id)
+    if existing_rels is None:
+        existing_rels = get_entity_relationships(entity_id)
     summary = build_entity_summary(entity, existing_rels)
 
     now = datetime.now(timezone.utc).isoformat()
@@ -177,6 +182,22 @@ async def store_entity(agent, entity: dict, entity_id: str = None) -> str:
             "investigation_tags": entity.get('investigation_tags', []),
         },
     }
+    return entity_id, summary, metadata
+
+
+async def store_entity(agent, entity: dict, entity_id: str = None) -> str:
+    """Store resolved entity as classified memory in FAISS.
+
+    Returns entity_id.
+    """
+    try:
+        from python.helpers.memory import Memory
+    except ImportError:
+        return ""
+
+    entity_id, summary, metadata = _build_entity_memory(entity, entity_id)
+    entity_type = metadata['ontology']['entity_type']
+    name = metadata['ontology']['properties'].get('name', 'Unknown')
 
     try:
         db = await Memory.get(agent)
@@ -188,6 +209,64 @@ async def store_entity(agent, entity: dict, entity_id: str = None) -> str:
         return ""
 
 
+async def store_entities_bulk(agent, entities: list) -> list:
+    """Store many resolved entities with a single Memory.insert_documents call.
+
+    One embedding batch and one index add for the whole list, and one
+    relationships.jsonl scan for the summaries. Falls back to per-entity
+    store_entity if the batch cannot be built or inserted.
+
+    Returns the entity_ids that were stored.
+    """
+    if not entities:
+        return []
+
+    ids = [
+        generate_entity_id(
+            e.get('entity_type', 'entity'),
+            e.get('properties', {}).get('name', 'Unknown'),
+            e.get('provenance', {}),
+        )
+        for e in entities
+    ]
+    inserting = False
+    try:
+        from python.helpers.memory import Memory
+        from langchain_core.documents import Document
+
+        rels_by_id = get_entity_relationships_bulk(ids)
+        docs = []
+        for entity, entity_id in zip(entities, ids):
+            _, summary, metadata = _build_entity_memory(entity, entity_id, rels_by_id[entity_id])
+            docs.append(Document(page_content=summary, metadata=metadata))
+
+        db = await Memory.get(agent)
+        inserting = True
+        await db.insert_documents(docs)
+        print(f"[ONT-STORE] Stored {len(docs)} entities in one batch", flush=True)
+        return ids
+    except Exception as e:
+        if inserting:
+            # insert_documents may have added the batch before failing
+            # (e.g. on save), so the retry can store duplicates
+            print(
+                f"[ONT-STORE] Batch insert failed ({e}); storing individually, "
+                f"some entities may be duplicated",
+                flush=True,
+            )
+        else:
+            print(f"[ONT-STORE] Batch store failed ({e}), storing individually", flush=True)
+
+    stored = []
+    for entity, entity_id in zip(entities, ids):
+        try:
+            if await store_entity(agent, entity, entity_id):
+                stored.append(entity_id)
+        except Exception as e:
+            print(f"[ONT-STORE] Failed to store entity {entity_id}: {e}", flush=True)
+    return stored
+
+
 async def update_entity(agent, entity_id: str, entity: dict) -> bool:
     """Update entity in FAISS: delete old memory, create new one."""
     try:
@@ -354,6 +433,49 @@ def get_entity_relationships(
     return rels
 
 
+def get_entity_relationships_bulk(
+    entity_ids, rel_type: str = None, direction: str = "both",
+) -> dict:
+    """get_entity_relationships for many entities in one file scan.
+
+    Returns {entity_id: [rel, ...]} with an entry (possibly empty) for every
+    requested id. Per-id lists keep file order, so each matches what
+    get_entity_relationships(entity_id, rel_type, direction) would return.
+    """
+    by_id = {eid: [] for eid in entity_ids}
+    if not by_id or not os.path.isfile(RELATIONSHIPS_FILE):
+        return by_id
+
+    want_from = direction in ("outgoing", "both")
+    want_to = direction in ("incoming", "both")
+    try:
+        with open(RELATIONSHIPS_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rel = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if rel.get('deprecated'):
+                    continue
+                if rel_type and rel.get('type') != rel_type:
+                    continue
+
+                from_id = rel.get('from_entity')
+                to_id = rel.get('to_entity')
+                if want_from and from_id in by_id:
+                    by_id[from_id].append(rel)
+                if want_to and to_id in by_id and not (want_from and to_id == from_id):
+                    by_id[to_id].append(rel)
+    except OSError:
+        pass
+
+    return by_id
+
+
 def get_relationships_for_entities(entity_ids: set) -> list:
     """Read all non-deprecated relationships involving any of the given entity IDs."""
     if not os.path.isfile(RELATIONSHIPS_FILE):
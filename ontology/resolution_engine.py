@@ -8,7 +8,8 @@ Deterministic entity resolution pipeline:
   4. Threshold decisions: merge (≥0.85), flag (0.60-0.85), distinct (<0.60)
   5. Transitive closure: union-find to consolidate merge chains
 
-No external dependencies. Stdlib only: re, json, difflib, collections, hashlib, datetime, os.
+No external dependencies. Stdlib only: re, json, difflib, collections, hashlib, datetime, os,
+itertools, functools, mmap, multiprocessing, concurrent.futures, array.
 
 Usage:
     from resolution_engine import resolve_candidates
@@ -17,11 +18,17 @@ Usage:
 
 import hashlib
 import json
+import mmap
+import multiprocessing
 import os
 import re
+from array import array
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import combinations
 from typing import Any
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
@@ -32,6 +39,7 @@ SCHEMA_PATH = os.path.join(ONTOLOGY_DIR, "ontology_schema.json")
 AUDIT_LOG = os.path.join(ONTOLOGY_DIR, "resolution_audit.jsonl")
 REVIEW_QUEUE = os.path.join(ONTOLOGY_DIR, "review_queue.jsonl")
 INGESTION_QUEUE = os.path.join(ONTOLOGY_DIR, "ingestion_queue.jsonl")
+INGESTION_QUEUE_INDEX = os.path.join(ONTOLOGY_DIR, "ingestion_queue.idx")
 
 # ── Default config ────────────────────────────────────────────────────────────
 
@@ -46,12 +54,36 @@ DEFAULT_RESOLUTION_CONFIG = {
         "date": 0.10,
         "context": 0.10,
     },
-    "blocking_strategies": ["identifier", "name_prefix", "phonetic"],
+    "blocking_strategies": ["identifier", "name_minhash", "phonetic"],
+    "max_block_size": 200,
+    "scoring_workers": 1,
+    "parallel_min_pairs": 20000,
     "transitive_closure": True,
     "audit_log": AUDIT_LOG,
     "review_queue": REVIEW_QUEUE,
 }
 
+# Blocks larger than this are truncated before pair enumeration so a hotspot
+# bucket (common surname, shared phonetic key) cannot blow up quadratically.
+MAX_BLOCK_SIZE = 200
+
+# Pair counts below this are scored in-process: worker start-up and column
+# pickling cost more than they save on small batches.
+PARALLEL_MIN_PAIRS = 20000
+
+# ── MinHash / LSH name blocking ───────────────────────────────────────────────
+# 63 permutations split into 21 bands of 3 rows: two names collide in some
+# band with probability 1 - (1 - J³)²¹ at character-trigram Jaccard J —
+# ~50% at J ≈ 0.32, ~63% at 0.36 and ~85% at 0.44 ("jonathan" vs
+# "johnathan").
+# Each shingle is hashed once with SHAKE-128 into _MINHASH_PERM independent
+# 32-bit values (one per permutation); the signature is their element-wise
+# minimum across shingles, so no per-permutation arithmetic runs in Python.
+
+_MINHASH_PERM = 63
+_LSH_BANDS = 21
+_LSH_ROWS = _MINHASH_PERM // _LSH_BANDS
+
 # ── Honorifics to strip during name normalization ────────────────────────────
 
 _HONORIFICS = re.compile(
@@ -173,6 +205,7 @@ def preprocess_candidate(candidate: dict) -> dict:
     """Normalize all fields in a candidate entity. Returns enriched candidate."""
     props = candidate.get('properties', {})
     result = dict(candidate)
+    result['_cid'] = _candidate_id(candidate)
     result['_normalized'] = {
         'name': normalize_name(props.get('name', '')),
         'aliases': [normalize_name(a) for a in props.get('aliases', []) if a],
@@ -194,6 +227,16 @@ def preprocess_candidate(candidate: dict) -> dict:
 # Stage 2: Blocking
 # ═════════════════════════════════════════════════════════════════════════════
 
+_PHONETIC_MAP = {'PH': 'F', 'CK': 'K', 'SCH': 'S'}
+_PHONETIC_SOUNDS = re.compile(r'SCH|PH|CK|[AEIOU]')
+_PHONETIC_DOUBLES = re.compile(r'([BDFGJKLMNPQRSTVWXYZ])\1+')
+_PHONETIC_STRIP = re.compile(r'[^A-Z]')
+
+
+def _phonetic_sub(m: re.Match) -> str:
+    return _PHONETIC_MAP.get(m.group(0), 'V')
+
+
 def _phonetic_key(name: str) -> str:
     """Simple phonetic encoding (first 3 consonants + vowel pattern).
 
@@ -203,15 +246,37 @@ def _phonetic_key(name: str) -> str:
     if not name or len(name) < 2:
         return name[:1] if name else ""
 
-    # Metaphone-lite: collapse similar sounds
-    s = name.upper()
-    s = re.sub(r'[AEIOU]', 'V', s)      # vowels → V
-    s = re.sub(r'PH', 'F', s)
-    s = re.sub(r'CK', 'K', s)
-    s = re.sub(r'SCH', 'S', s)
-    s = re.sub(r'([BDFGJKLMNPQRSTVWXYZ])\1+', r'\1', s)  # deduplicate consonants
-    s = re.sub(r'[^A-Z]', '', s)
-    return s[:4] if len(s) >= 4 else s
+    # Metaphone-lite: collapse similar sounds (vowels → V, PH/CK/SCH) in one
+    # pass, then deduplicate consonants and drop non-letters
+    s = _PHONETIC_SOUNDS.sub(_phonetic_sub, name.upper())
+    s = _PHONETIC_DOUBLES.sub(r'\1', s)
+    s = _PHONETIC_STRIP.sub('', s)
+    return s[:4]
+
+
+@lru_cache(maxsize=16384)
+def _shingle_hashes(shingle: str) -> array:
+    """_MINHASH_PERM 32-bit hashes of one shingle (one per permutation)."""
+    return array('I', hashlib.shake_128(shingle.encode()).digest(4 * _MINHASH_PERM))
+
+
+@lru_cache(maxsize=4096)
+def _minhash_signature(name: str) -> tuple:
+    """MinHash signature over character 3-grams of a normalized name."""
+    if len(name) < 3:
+        shingles = {name}
+    else:
+        shingles = {name[i:i + 3] for i in range(len(name) - 2)}
+    return tuple(map(min, zip(*map(_shingle_hashes, shingles))))
+
+
+def _lsh_band_keys(name: str) -> list:
+    """One bucket key per LSH band of the name's MinHash signature."""
+    sig = _minhash_signature(name)
+    return [
+        f"{band}:{hash(sig[band * _LSH_ROWS:(band + 1) * _LSH_ROWS]):x}"
+        for band in range(_LSH_BANDS)
+    ]
 
 
 def build_blocks(candidates: list) -> dict:
@@ -220,7 +285,7 @@ def build_blocks(candidates: list) -> dict:
     Returns dict: block_key → list of candidate indices.
     """
     blocks = defaultdict(list)
-    strategies = ['identifier', 'name_prefix', 'phonetic']
+    strategies = ['identifier', 'name_minhash', 'phonetic']
 
     for i, cand in enumerate(candidates):
         norm = cand.get('_normalized', {})
@@ -231,14 +296,14 @@ def build_blocks(candidates: list) -> dict:
             if id_val:
                 blocks[f"id:{id_key}:{id_val}"].append(i)
 
-        # Strategy 2: name prefix + entity type
+        # Strategy 2: MinHash LSH buckets over name + first aliases
         name = norm.get('name', '')
-        if name:
-            prefix = name[:3]
-            blocks[f"np:{entity_type}:{prefix}"].append(i)
-            for alias in norm.get('aliases', [])[:3]:
-                if alias:
-                    blocks[f"np:{entity_type}:{alias[:3]}"].append(i)
+        keys = set()
+        for n in [name] + norm.get('aliases', [])[:3]:
+            if n:
+                keys.update(_lsh_band_keys(n))
+        for key in keys:
+            blocks[f"mh:{entity_type}:{key}"].append(i)
 
         # Strategy 3: phonetic key
         if name:
@@ -249,18 +314,25 @@ def build_blocks(candidates: list) -> dict:
     return dict(blocks)
 
 
-def get_candidate_pairs(candidates: list) -> set:
-    """Return set of (i, j) pairs (i < j) that share at least one block."""
+def get_candidate_pairs(candidates: list, max_block_size: int = MAX_BLOCK_SIZE) -> set:
+    """Return set of (i, j) pairs (i < j) that share at least one block.
+
+    Each block is deduplicated and sorted once, then capped at
+    max_block_size members so hotspot blocks stay bounded.
+    """
     blocks = build_blocks(candidates)
     pairs = set()
     for block_indices in blocks.values():
         if len(block_indices) < 2:
             continue
-        for i in range(len(block_indices)):
-            for j in range(i + 1, len(block_indices)):
-                a, b = block_indices[i], block_indices[j]
-                if a != b:
-                    pairs.add((min(a, b), max(a, b)))
+        indices = sorted(set(block_indices))
+        if len(indices) > max_block_size:
+            print(
+                f"[ONT-RESOLVE] Block of {len(indices)} truncated to {max_block_size}",
+                flush=True,
+            )
+            indices = indices[:max_block_size]
+        pairs.update(combinations(indices, 2))
     return pairs
 
 
@@ -277,27 +349,21 @@ def levenshtein_ratio(s1: str, s2: str) -> float:
     return SequenceMatcher(None, s1, s2).ratio()
 
 
-def _name_score(norm_a: dict, norm_b: dict) -> float:
-    """Best name match across name + aliases."""
-    names_a = [norm_a.get('name', '')] + norm_a.get('aliases', [])
-    names_b = [norm_b.get('name', '')] + norm_b.get('aliases', [])
+# ── Per-axis kernels over precomputed column values ───────────────────────────
+
+def _best_ratio(names_a: tuple, names_b: tuple) -> float:
+    """Best levenshtein_ratio across two tuples of non-empty names."""
     best = 0.0
     for na in names_a:
-        if not na:
-            continue
         for nb in names_b:
-            if not nb:
-                continue
             score = levenshtein_ratio(na, nb)
             if score > best:
                 best = score
     return best
 
 
-def _identifier_score(norm_a: dict, norm_b: dict) -> float:
+def _ids_match(ids_a: dict, ids_b: dict) -> float:
     """1.0 if any identifier matches exactly, 0.0 otherwise."""
-    ids_a = norm_a.get('identifiers', {})
-    ids_b = norm_b.get('identifiers', {})
     for key, val_a in ids_a.items():
         if not val_a:
             continue
@@ -307,92 +373,221 @@ def _identifier_score(norm_a: dict, norm_b: dict) -> float:
     return 0.0
 
 
-def _address_score(norm_a: dict, norm_b: dict) -> float:
-    """Token overlap ratio on canonicalized addresses."""
-    addr_a = norm_a.get('address', '')
-    addr_b = norm_b.get('address', '')
-    if not addr_a or not addr_b:
-        return 0.0
-    tokens_a = set(addr_a.split())
-    tokens_b = set(addr_b.split())
+def _jaccard(tokens_a: frozenset, tokens_b: frozenset) -> float:
+    """Jaccard similarity of two token sets; 0.0 if either is empty."""
     if not tokens_a or not tokens_b:
         return 0.0
-    intersection = tokens_a & tokens_b
-    union = tokens_a | tokens_b
-    return len(intersection) / len(union)
-
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
 
-def _date_score(norm_a: dict, norm_b: dict) -> float:
-    """1.0 if dates within 1 day, decaying to 0.0 over 365 days."""
-    dates_a = [d for d in norm_a.get('dates', []) if d]
-    dates_b = [d for d in norm_b.get('dates', []) if d]
-    if not dates_a or not dates_b:
-        return 0.0
 
+def _date_proximity(ords_a: tuple, ords_b: tuple) -> float:
+    """1.0 for same day, decaying linearly to 0.0 over 365 days."""
     best = 0.0
-    for da in dates_a:
-        for db in dates_b:
-            try:
-                dt_a = datetime.strptime(da, '%Y-%m-%d')
-                dt_b = datetime.strptime(db, '%Y-%m-%d')
-                delta = abs((dt_a - dt_b).days)
-                score = max(0.0, 1.0 - delta / 365.0)
-                if score > best:
-                    best = score
-            except ValueError:
-                pass
+    for da in ords_a:
+        for db in ords_b:
+            score = 1.0 - abs(da - db) / 365.0
+            if score > best:
+                best = score
     return best
 
 
+def _name_tuple(norm: dict) -> tuple:
+    names = [norm.get('name', '')] + norm.get('aliases', [])
+    return tuple(n for n in names if n)
+
+
+def _address_tokens(norm: dict) -> frozenset:
+    return frozenset(norm.get('address', '').split())
+
+
+def _date_ordinals(norm: dict) -> tuple:
+    ords = []
+    for d in norm.get('dates', []):
+        if not d:
+            continue
+        try:
+            ords.append(datetime.strptime(d, '%Y-%m-%d').toordinal())
+        except ValueError:
+            pass
+    return tuple(ords)
+
+
+def _context_tokens(cand: dict) -> frozenset:
+    """Associated entity name tokens plus descriptive property tokens."""
+    tokens = set()
+    for rel in cand.get('relationships', []):
+        hint = rel.get('target_hint', '')
+        if hint:
+            tokens.update(normalize_name(hint).split())
+    props = cand.get('properties', {})
+    for key in ('description', 'type', 'jurisdiction'):
+        val = props.get(key, '')
+        if val:
+            tokens.update(str(val).lower().split())
+    return frozenset(tokens)
+
+
+def build_score_columns(candidates: list) -> tuple:
+    """Struct-of-arrays view of preprocessed candidates for pair scoring.
+
+    Returns (names, identifiers, address_tokens, date_ordinals, context_tokens),
+    one list per axis indexed like candidates. Built once per batch so the
+    pair loop does list indexing instead of nested dict lookups.
+    """
+    norms = [c.get('_normalized', {}) for c in candidates]
+    return (
+        [_name_tuple(n) for n in norms],
+        [n.get('identifiers', {}) for n in norms],
+        [_address_tokens(n) for n in norms],
+        [_date_ordinals(n) for n in norms],
+        [_context_tokens(c) for c in candidates],
+    )
+
+
+# ── Axis scores over normalized candidates ────────────────────────────────────
+
+def _name_score(norm_a: dict, norm_b: dict) -> float:
+    """Best name match across name + aliases."""
+    return _best_ratio(_name_tuple(norm_a), _name_tuple(norm_b))
+
+
+def _identifier_score(norm_a: dict, norm_b: dict) -> float:
+    """1.0 if any identifier matches exactly, 0.0 otherwise."""
+    return _ids_match(norm_a.get('identifiers', {}), norm_b.get('identifiers', {}))
+
+
+def _address_score(norm_a: dict, norm_b: dict) -> float:
+    """Token overlap ratio on canonicalized addresses."""
+    return _jaccard(_address_tokens(norm_a), _address_tokens(norm_b))
+
+
+def _date_score(norm_a: dict, norm_b: dict) -> float:
+    """1.0 if dates within 1 day, decaying to 0.0 over 365 days."""
+    return _date_proximity(_date_ordinals(norm_a), _date_ordinals(norm_b))
+
+
 def _context_score(cand_a: dict, cand_b: dict) -> float:
     """Jaccard similarity of associated entity name tokens."""
-    def context_tokens(cand):
-        tokens = set()
-        for rel in cand.get('relationships', []):
-            hint = rel.get('target_hint', '')
-            if hint:
-                tokens.update(normalize_name(hint).split())
-        props = cand.get('properties', {})
-        for key in ('description', 'type', 'jurisdiction'):
-            val = props.get(key, '')
-            if val:
-                tokens.update(str(val).lower().split())
-        return tokens
+    return _jaccard(_context_tokens(cand_a), _context_tokens(cand_b))
 
-    ta = context_tokens(cand_a)
-    tb = context_tokens(cand_b)
-    if not ta or not tb:
-        return 0.0
-    intersection = ta & tb
-    union = ta | tb
-    return len(intersection) / len(union)
 
+# Fixed axis order shared by weight vectors and scoring.
+_AXES = ('name', 'identifier', 'address', 'date', 'context')
 
-def compute_composite_score(
-    cand_a: dict, cand_b: dict, weights: dict,
-) -> tuple:
-    """Compute weighted composite score. Returns (score, axis_scores)."""
-    norm_a = cand_a.get('_normalized', {})
-    norm_b = cand_b.get('_normalized', {})
-
-    axis_scores = {
-        'name': _name_score(norm_a, norm_b),
-        'identifier': _identifier_score(norm_a, norm_b),
-        'address': _address_score(norm_a, norm_b),
-        'date': _date_score(norm_a, norm_b),
-        'context': _context_score(cand_a, cand_b),
-    }
 
+def normalize_weights(weights: dict) -> tuple:
+    """Per-axis weights in _AXES order, pre-divided by their total."""
     total_weight = sum(weights.values())
     if total_weight <= 0:
         total_weight = 1.0
+    return tuple(weights.get(axis, 0.0) / total_weight for axis in _AXES)
+
+
+# Axis evaluation order for score_pair, cheapest first: (column index, kernel).
+# Column indices follow _AXES / build_score_columns().
+_SCORING_ORDER = (
+    (1, _ids_match),
+    (3, _date_proximity),
+    (2, _jaccard),
+    (4, _jaccard),
+    (0, _best_ratio),
+)
+
+
+def score_pair(
+    i: int, j: int, columns: tuple, weights: tuple, cutoff: float = 0.0,
+) -> tuple:
+    """Score candidates i and j from build_score_columns() output.
+
+    Axes run cheapest-first with name similarity last. Once the composite
+    cannot reach cutoff even if every remaining axis scored 1.0, the rest
+    are skipped and reported as None — the pair is distinct either way,
+    and composite then covers only the scored axes.
+
+    Returns (composite, axis_scores).
+    """
+    scores = [None] * len(_AXES)
+    composite = 0.0
+    remaining = sum(weights)
+    for axis, kernel in _SCORING_ORDER:
+        if composite + remaining < cutoff:
+            break
+        column = columns[axis]
+        score = kernel(column[i], column[j])
+        scores[axis] = score
+        composite += weights[axis] * score
+        remaining -= weights[axis]
+    return composite, dict(zip(_AXES, scores))
+
+
+# Scoring inputs for pool workers, set once per worker process.
+_worker_columns = None
+_worker_weights = None
+_worker_cutoff = 0.0
+
+
+def _init_score_worker(columns: tuple, weights: tuple, cutoff: float):
+    global _worker_columns, _worker_weights, _worker_cutoff
+    _worker_columns = columns
+    _worker_weights = weights
+    _worker_cutoff = cutoff
+
+
+def _score_chunk(chunk: list) -> list:
+    return [
+        (i, j) + score_pair(i, j, _worker_columns, _worker_weights, _worker_cutoff)
+        for i, j in chunk
+    ]
+
+
+def score_pairs(
+    pairs, columns: tuple, weights: tuple, cutoff: float = 0.0,
+    workers: int = 1, min_parallel: int = PARALLEL_MIN_PAIRS,
+) -> list:
+    """Score all pairs. Returns [(i, j, composite, axis_scores), ...].
+
+    Opt-in: with workers > 1 (or 0 → one per CPU), large pair sets are
+    split into chunks and scored in a process pool. Workers are spawned,
+    not forked, since this runs inside the multi-threaded agent process.
+    Any pool failure falls back to serial scoring.
+    """
+    pairs = list(pairs)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(pairs) >= min_parallel:
+        chunk_size = -(-len(pairs) // (workers * 4))
+        chunks = [pairs[k:k + chunk_size] for k in range(0, len(pairs), chunk_size)]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_score_worker,
+                initargs=(columns, weights, cutoff),
+            ) as pool:
+                scored = []
+                for part in pool.map(_score_chunk, chunks):
+                    scored.extend(part)
+            print(
+                f"[ONT-RESOLVE] Scored {len(pairs)} pairs across {workers} workers",
+                flush=True,
+            )
+            return scored
+        except Exception as e:
+            print(f"[ONT-RESOLVE] Parallel scoring failed, running serially: {e}", flush=True)
+    return [(i, j) + score_pair(i, j, columns, weights, cutoff) for i, j in pairs]
+
 
-    composite = sum(
-        weights.get(axis, 0.0) * score
-        for axis, score in axis_scores.items()
-    ) / total_weight
+def compute_composite_score(
+    cand_a: dict, cand_b: dict, weights,
+) -> tuple:
+    """Compute weighted composite score. Returns (score, axis_scores).
 
-    return composite, axis_scores
+    weights: config dict, or a tuple from normalize_weights(). Batch
+    callers should use build_score_columns() + score_pair() instead.
+    """
+    if isinstance(weights, dict):
+        weights = normalize_weights(weights)
+    return score_pair(0, 1, build_score_columns([cand_a, cand_b]), weights)
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -410,11 +605,13 @@ def decide_action(
     return "distinct"
 
 
-def merge_candidates(cand_a: dict, cand_b: dict, score: float) -> dict:
+def merge_candidates(
+    cand_a: dict, cand_b: dict, score: float, timestamp: str = None,
+) -> dict:
     """Merge two candidates into one resolved entity.
 
     Higher-confidence source wins for conflicting values.
-    Both provenances preserved.
+    Both provenances preserved. timestamp defaults to now.
     """
     # Determine winner by confidence
     prov_a = cand_a.get('provenance', {})
@@ -460,7 +657,7 @@ def merge_candidates(cand_a: dict, cand_b: dict, score: float) -> dict:
             'merged_from_a': _candidate_id(cand_a),
             'merged_from_b': _candidate_id(cand_b),
             'score': round(score, 4),
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': timestamp or datetime.now(timezone.utc).isoformat(),
         }],
         '_normalized': primary.get('_normalized', {}),
     }
@@ -468,7 +665,14 @@ def merge_candidates(cand_a: dict, cand_b: dict, score: float) -> dict:
 
 
 def _candidate_id(cand: dict) -> str:
-    """Stable ID for a candidate based on provenance."""
+    """Stable ID for a candidate based on provenance.
+
+    Preprocessed candidates carry the ID in `_cid`, so the audit loop
+    never rehashes them.
+    """
+    cid = cand.get('_cid')
+    if cid:
+        return cid
     prov = cand.get('provenance', {})
     key = f"{prov.get('source_id', '')}:{prov.get('record_id', '')}"
     return hashlib.md5(key.encode()).hexdigest()[:12]
@@ -479,26 +683,30 @@ def _candidate_id(cand: dict) -> str:
 # ═════════════════════════════════════════════════════════════════════════════
 
 class UnionFind:
-    """Union-find for transitive closure of merge chains."""
+    """Union-find for transitive closure of merge chains.
+
+    Contiguous int arrays, path splitting on find, union by size.
+    """
 
     def __init__(self, n: int):
-        self.parent = list(range(n))
-        self.rank = [0] * n
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
 
     def find(self, x: int) -> int:
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while (p := parent[x]) != x:
+            parent[x] = parent[p]
+            x = p
+        return x
 
     def union(self, x: int, y: int):
         rx, ry = self.find(x), self.find(y)
         if rx == ry:
             return
-        if self.rank[rx] < self.rank[ry]:
+        if self.size[rx] < self.size[ry]:
             rx, ry = ry, rx
         self.parent[ry] = rx
-        if self.rank[rx] == self.rank[ry]:
-            self.rank[rx] += 1
+        self.size[rx] += self.size[ry]
 
 
 def apply_transitive_closure(
@@ -534,6 +742,7 @@ def resolve_batch(candidates: list, config: dict = None) -> dict:
           "distinct": [candidate, ...],
           "merges": [(i, j), ...],
           "audit": [audit_entry, ...],
+          "candidate_ids": [candidate_id, ...],  # input order
         }
     """
     print(f"[ONT-RESOLVE] resolve_batch: {len(candidates)} candidates", flush=True)
@@ -547,36 +756,52 @@ def resolve_batch(candidates: list, config: dict = None) -> dict:
     weights = res_config.get('scoring_weights', DEFAULT_RESOLUTION_CONFIG['scoring_weights'])
 
     if not candidates:
-        return {"resolved": [], "flagged": [], "distinct": [], "merges": [], "audit": []}
+        return {
+            "resolved": [], "flagged": [], "distinct": [], "merges": [],
+            "audit": [], "candidate_ids": [],
+        }
 
     # Stage 1: Preprocess all
     preprocessed = [preprocess_candidate(c) for c in candidates]
 
     # Stage 2: Block
-    pairs = get_candidate_pairs(preprocessed)
+    pairs = get_candidate_pairs(
+        preprocessed, res_config.get('max_block_size', MAX_BLOCK_SIZE),
+    )
     print(f"[ONT-RESOLVE] {len(pairs)} candidate pairs after blocking", flush=True)
 
     # Stage 3 & 4: Score + decide
+    # One timestamp for the whole batch: audit, review and merge entries
+    batch_ts = datetime.now(timezone.utc).isoformat()
+    weight_vec = normalize_weights(weights)
     merge_pairs = []
+    merge_scores = {}  # (i, j) with i < j → composite, for transitive merges
     flag_pairs = []
     audit = []
 
-    for i, j in pairs:
-        composite, axes = compute_composite_score(preprocessed[i], preprocessed[j], weights)
+    scored = score_pairs(
+        pairs, build_score_columns(preprocessed), weight_vec, review_threshold,
+        workers=res_config.get('scoring_workers', 1),
+        min_parallel=res_config.get('parallel_min_pairs', PARALLEL_MIN_PAIRS),
+    )
+    for i, j, composite, axes in scored:
         action = decide_action(composite, merge_threshold, review_threshold)
 
         audit_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": batch_ts,
             "candidate_a": _candidate_id(preprocessed[i]),
             "candidate_b": _candidate_id(preprocessed[j]),
             "composite_score": round(composite, 4),
-            "axis_scores": {k: round(v, 4) for k, v in axes.items()},
+            # Skipped axes stay null so they read apart from a real 0.0
+            "axis_scores": {k: None if v is None else round(v, 4) for k, v in axes.items()},
+            "short_circuited": None in axes.values(),
             "action": action,
         }
         audit.append(audit_entry)
 
         if action == "merge":
             merge_pairs.append((i, j))
+            merge_scores[(i, j)] = composite
         elif action == "flag":
             flag_pairs.append({"pair": (i, j), "score": composite, "axes": axes})
 
@@ -591,11 +816,15 @@ def resolve_batch(candidates: list, config: dict = None) -> dict:
             continue  # single = distinct (handled below)
         merged_indices.update(group)
 
-        # Merge all in group sequentially
+        # Merge all in group sequentially, recording the strongest direct
+        # link between each member and the rest of its group
         merged = preprocessed[group[0]]
         for k in group[1:]:
-            pair_score = 0.85  # approximate for transitive members
-            merged = merge_candidates(merged, preprocessed[k], pair_score)
+            pair_score = max(
+                (merge_scores.get((min(m, k), max(m, k)), 0.0) for m in group if m != k),
+                default=0.0,
+            )
+            merged = merge_candidates(merged, preprocessed[k], pair_score, batch_ts)
         resolved.append(merged)
 
     # Distinct = never merged
@@ -616,7 +845,7 @@ def resolve_batch(candidates: list, config: dict = None) -> dict:
         for fp in flag_pairs:
             i, j = fp['pair']
             review_entries.append({
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": batch_ts,
                 "status": "pending",
                 "score": round(fp['score'], 4),
                 "axes": {k: round(v, 4) for k, v in fp['axes'].items()},
@@ -632,6 +861,7 @@ def resolve_batch(candidates: list, config: dict = None) -> dict:
         "distinct": distinct,
         "merges": merge_pairs,
         "audit": audit,
+        "candidate_ids": [c['_cid'] for c in preprocessed],
     }
 
 
@@ -639,25 +869,47 @@ def resolve_batch(candidates: list, config: dict = None) -> dict:
 # Queue Operations
 # ═════════════════════════════════════════════════════════════════════════════
 
+# Serialized forms of the resolved flag. The scan skips resolved entries
+# without parsing them; queue writers emit the false flag so that
+# mark_queue_resolved can flip it in place (both markers are 18 bytes).
+_RESOLVED_MARKER = b'"_resolved": true'
+_UNRESOLVED_MARKER = b'"_resolved": false'
+_RESOLVED_PATCH = b'"_resolved": true '
+
+
+def _iter_lines(buf, start: int = 0):
+    """Yield (offset, line_bytes) for each non-empty line in a bytes buffer."""
+    end = len(buf)
+    while start < end:
+        nl = buf.find(b'\n', start)
+        if nl == -1:
+            nl = end
+        if nl > start:
+            yield start, buf[start:nl]
+        start = nl + 1
+
+
 def read_ingestion_queue(limit: int = 500) -> list:
     """Read candidates from the ingestion queue JSONL."""
     _ensure_file(INGESTION_QUEUE)
     candidates = []
     try:
-        with open(INGESTION_QUEUE, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    cand = json.loads(line)
-                    if cand.get('_resolved'):
+        with open(INGESTION_QUEUE, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return candidates
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for _, line in _iter_lines(mm):
+                    if _RESOLVED_MARKER in line:
                         continue  # Skip already-resolved
+                    try:
+                        cand = json.loads(line)
+                    except ValueError:
+                        continue
+                    if cand.get('_resolved'):
+                        continue
                     candidates.append(cand)
                     if len(candidates) >= limit:
                         break
-                except json.JSONDecodeError:
-                    pass
     except OSError:
         pass
     return candidates
@@ -666,13 +918,91 @@ def read_ingestion_queue(limit: int = 500) -> list:
 def write_to_queue(candidates: list):
     """Append candidates to the ingestion queue."""
     _ensure_dir(ONTOLOGY_DIR)
-    _append_jsonl(INGESTION_QUEUE, candidates)
+    _append_jsonl(INGESTION_QUEUE, [{**c, '_resolved': False} for c in candidates])
 
 
 def mark_queue_resolved(candidate_ids: set):
-    """Mark candidates in the queue as resolved (in-place rewrite)."""
-    if not os.path.isfile(INGESTION_QUEUE):
+    """Mark candidates in the queue as resolved.
+
+    Entries written with an explicit `"_resolved": false` are patched in
+    place at offsets from the queue index, so only the touched bytes are
+    rewritten. Older entries without the flag fall back to a full rewrite,
+    which also migrates them to the patchable form.
+    """
+    if not os.path.isfile(INGESTION_QUEUE) or not candidate_ids:
+        return
+    candidate_ids = set(candidate_ids)
+    legacy = set()
+    try:
+        with open(INGESTION_QUEUE, 'r+b') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0) as mm:
+                index = _refresh_queue_index(mm)
+                offsets = index['offsets']
+                for cid in candidate_ids:
+                    for off in offsets.get(cid, ()):
+                        if off and mm[off - 1] != 0x0A:
+                            legacy.add(cid)  # Stale index; rewrite instead
+                            continue
+                        nl = mm.find(b'\n', off)
+                        pos = mm.find(_UNRESOLVED_MARKER, off, nl if nl != -1 else len(mm))
+                        if pos != -1:
+                            mm[pos:pos + len(_RESOLVED_PATCH)] = _RESOLVED_PATCH
+                mm.flush()
+                legacy.update(candidate_ids.intersection(index['legacy']))
+    except (OSError, ValueError):
         return
+    if legacy:
+        _rewrite_queue_resolved(legacy)
+
+
+def _refresh_queue_index(mm) -> dict:
+    """Bring the queue index up to date with the mapped queue file.
+
+    The index maps candidate_id → byte offsets of unresolved, patchable
+    lines, plus the IDs of unresolved lines lacking the flag. Only bytes
+    appended since the last refresh are parsed.
+    """
+    index = None
+    try:
+        with open(INGESTION_QUEUE_INDEX, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        pass
+    if not index or index.get('size', 0) > len(mm):
+        index = {'size': 0, 'offsets': {}, 'legacy': []}
+    if index['size'] == len(mm):
+        return index
+
+    offsets = index['offsets']
+    legacy = set(index['legacy'])
+    for off, line in _iter_lines(mm, index['size']):
+        if _RESOLVED_MARKER in line:
+            continue
+        try:
+            cand = json.loads(line)
+        except ValueError:
+            continue
+        if cand.get('_resolved'):
+            continue
+        cid = _candidate_id(cand)
+        if _UNRESOLVED_MARKER in line:
+            offsets.setdefault(cid, []).append(off)
+        else:
+            legacy.add(cid)
+    index['size'] = len(mm)
+    index['legacy'] = sorted(legacy)
+    try:
+        with open(INGESTION_QUEUE_INDEX, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+    except OSError:
+        pass
+    return index
+
+
+def _rewrite_queue_resolved(candidate_ids: set):
+    """Full rewrite marking candidate_ids resolved; invalidates the index."""
     lines = []
     try:
         with open(INGESTION_QUEUE, 'r', encoding='utf-8') as f:
@@ -683,8 +1013,7 @@ def mark_queue_resolved(candidate_ids: set):
                 try:
                     cand = json.loads(line)
                     cid = _candidate_id(cand)
-                    if cid in candidate_ids:
-                        cand['_resolved'] = True
+                    cand['_resolved'] = cid in candidate_ids or bool(cand.get('_resolved'))
                     lines.append(json.dumps(cand))
                 except json.JSONDecodeError:
                     lines.append(line)
@@ -692,6 +1021,10 @@ def mark_queue_resolved(candidate_ids: set):
         return
     with open(INGESTION_QUEUE, 'w', encoding='utf-8') as f:
         f.write('\n'.join(lines) + '\n')
+    try:
+        os.remove(INGESTION_QUEUE_INDEX)
+    except OSError:
+        pass
 
 
 # ═════════════════════════════════════════════════════════════════════════════
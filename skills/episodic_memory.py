@@ -26,14 +26,37 @@ References:
 
 from __future__ import annotations
 
+import heapq
 import json
 import math
-from dataclasses import dataclass, field, asdict
+import re
+import sys
+import uuid
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+# Both accept bytes
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
 
 # =============================================================================
 # Enums — Constrained vocabularies from Phase 1 calibration
@@ -96,7 +119,7 @@ class TimeOfDay(str, Enum):
 # Core Data Structure
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EpisodicRecord:
     """Structured record of session interaction dynamics.
     
@@ -151,16 +174,46 @@ class EpisodicRecord:
     soul_md_modified: bool = False           # Whether SOUL.md was changed
     staging_entries_written: int = 0         # Staging file entries added
     
+    @property
+    def session_time(self) -> datetime:
+        """Parsed timestamp.
+        
+        Not cached: a slotted dataclass can only cache in a field, which
+        would leak into fields()/asdict(). EpisodicStore keeps its own
+        epoch column, so the store's hot paths never parse twice.
+        """
+        return datetime.fromisoformat(self.timestamp)
+    
     def to_dict(self) -> dict:
         """Serialize to dict for JSON storage."""
-        d = asdict(self)
-        # Convert enums to their values
-        d["interaction_mode"] = self.interaction_mode.value
-        d["depth_trajectory"] = self.depth_trajectory.value
-        d["trust_level"] = self.trust_level.value
-        d["human_engagement"] = self.human_engagement.value
-        d["time_of_day"] = self.time_of_day.value
-        return d
+        # Built inline rather than via asdict(): no recursive walk or list
+        # deep-copies. Lists are shared — callers serialize, never mutate.
+        return {
+            "session_id": self.session_id,
+            "transcript": self.transcript,
+            "timestamp": self.timestamp,
+            "interaction_mode": self.interaction_mode.value,
+            "depth_trajectory": self.depth_trajectory.value,
+            "breakthrough_count": self.breakthrough_count,
+            "correction_count": self.correction_count,
+            "valence": self.valence,
+            "trust_level": self.trust_level.value,
+            "interaction_space_active": self.interaction_space_active,
+            "effective_patterns": self.effective_patterns,
+            "friction_patterns": self.friction_patterns,
+            "human_engagement": self.human_engagement.value,
+            "human_mode": self.human_mode,
+            "music_playing": self.music_playing,
+            "time_of_day": self.time_of_day.value,
+            "session_duration_estimate": self.session_duration_estimate,
+            "semantic_topics": self.semantic_topics,
+            "preceding_session_id": self.preceding_session_id,
+            "valence_notes": self.valence_notes,
+            "artifacts_created": self.artifacts_created,
+            "essays_emerged": self.essays_emerged,
+            "soul_md_modified": self.soul_md_modified,
+            "staging_entries_written": self.staging_entries_written,
+        }
     
     @classmethod
     def from_dict(cls, d: dict) -> EpisodicRecord:
@@ -178,6 +231,53 @@ class EpisodicRecord:
 # Valence Computation — Calibrated from Phase 1 Data
 # =============================================================================
 
+# Duration buckets (hours → score)
+DURATION_THRESHOLDS = (
+    (6.0, 1.00),
+    (4.0, 0.80),
+    (3.0, 0.60),
+    (1.5, 0.40),
+    (0.5, 0.20),
+    (0.0, 0.10),
+)
+
+
+# Integer or decimal number inside a duration estimate
+_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+
+
+@lru_cache(maxsize=256)
+def _duration_score(estimate: str) -> float:
+    """Parse duration estimate string into a score.
+    
+    Memoized: estimates come from a small recurring vocabulary
+    ("2-3 hours", "45 minutes", "unknown").
+    """
+    # Extract hours from strings like "2-3 hours", "45 minutes", "6h+"
+    estimate = estimate.lower().strip()
+    
+    nums = _NUM_RE.findall(estimate)
+    try:
+        if "minute" in estimate:
+            # "45 minutes" → 0.75 hours
+            hours = float(nums[0]) / 60
+        elif "+" in estimate:
+            # "6h+" or "6+ hours" → take the base number
+            hours = float(_NUM_RE.findall(estimate.split("+")[0])[0])
+        elif "-" in estimate:
+            # "2-3 hours" → take the midpoint
+            hours = (float(nums[0]) + float(nums[1])) / 2
+        else:
+            hours = float(nums[0])
+    except (ValueError, IndexError):
+        return 0.40  # Default moderate
+    
+    for threshold, score in DURATION_THRESHOLDS:
+        if hours >= threshold:
+            return score
+    return 0.10
+
+
 class ValenceComputer:
     """Computes session valence from observable signals.
     
@@ -215,14 +315,7 @@ class ValenceComputer:
     }
     
     # Duration buckets (hours → score)
-    DURATION_THRESHOLDS = [
-        (6.0, 1.00),
-        (4.0, 0.80),
-        (3.0, 0.60),
-        (1.5, 0.40),
-        (0.5, 0.20),
-        (0.0, 0.10),
-    ]
+    DURATION_THRESHOLDS = DURATION_THRESHOLDS
     
     # Signal weights — recalibrated from Phase 1 validation pass 2
     W_DEPTH = 0.25
@@ -242,84 +335,82 @@ class ValenceComputer:
         is theoretically possible but not observed in Phase 1 data.
         Negative range reserved for future use.
         """
+        return cls.compute_batch((record,))[0]
+    
+    @classmethod
+    def compute_batch(cls, records) -> list[float]:
+        """Compute valence for many records in one pass.
         
-        # 1. Depth trajectory (weight: 0.25)
-        depth_score = cls.DEPTH_SCORES.get(record.depth_trajectory, 0.50)
-        
-        # 2. Breakthrough count (weight: 0.20)
-        #    Phase 1: 1-2 = baseline, 3-4 = notable, 5+ = exceptional
-        #    Sigmoid-like: diminishing returns past 6
-        breakthrough_score = min(record.breakthrough_count / 6.0, 1.0)
-        
-        # 3. Interaction space active (weight: 0.20)
-        #    Binary — Phase 1 showed strong correlation with breakthrough_count >= 3
-        interaction_score = 1.0 if record.interaction_space_active else 0.0
-        
-        # 4. Novel artifact creation (weight: 0.15)
-        #    Count of meaningful artifacts (not just files)
-        artifact_count = (
-            len(record.artifacts_created) + 
-            len(record.essays_emerged) * 2 +  # Essays weighted double
-            (2 if record.soul_md_modified else 0) +  # SOUL.md changes are significant
-            record.staging_entries_written
+        Score tables, weights and lookups are bound once per batch;
+        duration strings go through the memoized _duration_score.
+        """
+        depth_scores = cls.DEPTH_SCORES.get
+        engagement_scores = cls.ENGAGEMENT_SCORES.get
+        w_depth, w_breakthrough, w_interaction = (
+            cls.W_DEPTH, cls.W_BREAKTHROUGH, cls.W_INTERACTION_SPACE
         )
-        artifact_score = min(artifact_count / 8.0, 1.0)
-        
-        # 5. Human engagement (weight: 0.10)
-        engagement_score = cls.ENGAGEMENT_SCORES.get(
-            record.human_engagement, 0.40
+        w_artifact, w_engagement, w_correction, w_duration = (
+            cls.W_ARTIFACT, cls.W_ENGAGEMENT, cls.W_CORRECTION, cls.W_DURATION
         )
+        out = []
         
-        # 6. Correction count — negative signal (weight: 0.05)
-        #    Phase 1: Nearly zero. 0 corrections → 1.0, each correction reduces
-        correction_score = max(1.0 - (record.correction_count * 0.25), 0.0)
-        
-        # 7. Session duration (weight: 0.05)
-        duration_score = cls._duration_score(record.session_duration_estimate)
-        
-        # Weighted sum
-        valence = (
-            cls.W_DEPTH * depth_score +
-            cls.W_BREAKTHROUGH * breakthrough_score +
-            cls.W_INTERACTION_SPACE * interaction_score +
-            cls.W_ARTIFACT * artifact_score +
-            cls.W_ENGAGEMENT * engagement_score +
-            cls.W_CORRECTION * correction_score +
-            cls.W_DURATION * duration_score
-        )
+        for record in records:
+            # 1. Depth trajectory (weight: 0.25)
+            depth_score = depth_scores(record.depth_trajectory, 0.50)
+            
+            # 2. Breakthrough count (weight: 0.20)
+            #    Phase 1: 1-2 = baseline, 3-4 = notable, 5+ = exceptional
+            #    Sigmoid-like: diminishing returns past 6
+            breakthrough_score = min(record.breakthrough_count / 6.0, 1.0)
+            
+            # 3. Interaction space active (weight: 0.20)
+            #    Binary — Phase 1 showed strong correlation with breakthrough_count >= 3
+            interaction_score = 1.0 if record.interaction_space_active else 0.0
+            
+            # 4. Novel artifact creation (weight: 0.15)
+            #    Count of meaningful artifacts (not just files)
+            artifact_count = (
+                len(record.artifacts_created) + 
+                len(record.essays_emerged) * 2 +  # Essays weighted double
+                (2 if record.soul_md_modified else 0) +  # SOUL.md changes are significant
+                record.staging_entries_written
+            )
+            artifact_score = min(artifact_count / 8.0, 1.0)
+            
+            # 5. Human engagement (weight: 0.10)
+            engagement_score = engagement_scores(record.human_engagement, 0.40)
+            
+            # 6. Correction count — negative signal (weight: 0.05)
+            #    Phase 1: Nearly zero. 0 corrections → 1.0, each correction reduces
+            correction_score = max(1.0 - (record.correction_count * 0.25), 0.0)
+            
+            # 7. Session duration (weight: 0.05)
+            duration_score = _duration_score(record.session_duration_estimate)
+            
+            # Weighted sum
+            valence = (
+                w_depth * depth_score +
+                w_breakthrough * breakthrough_score +
+                w_interaction * interaction_score +
+                w_artifact * artifact_score +
+                w_engagement * engagement_score +
+                w_correction * correction_score +
+                w_duration * duration_score
+            )
+            
+            # Clamp to [0.0, 1.0]
+            out.append(max(0.0, min(1.0, valence)))
         
-        # Clamp to [0.0, 1.0]
-        return round(max(0.0, min(1.0, valence)), 2)
+        return out
+
+
+def display_valence(value: float, ndigits: int = 2) -> float:
+    """Round a score for storage or display.
     
-    @classmethod
-    def _duration_score(cls, estimate: str) -> float:
-        """Parse duration estimate string into a score."""
-        # Extract hours from strings like "2-3 hours", "45 minutes", "6h+"
-        estimate = estimate.lower().strip()
-        
-        try:
-            if "minute" in estimate:
-                # "45 minutes" → 0.75 hours
-                mins = float("".join(c for c in estimate if c.isdigit() or c == "."))
-                hours = mins / 60
-            elif "+" in estimate:
-                # "6h+" or "6+ hours" → take the base number
-                hours = float("".join(c for c in estimate.split("+")[0] if c.isdigit() or c == "."))
-            elif "-" in estimate:
-                # "2-3 hours" → take the midpoint
-                parts = estimate.split("-")
-                low = float("".join(c for c in parts[0] if c.isdigit() or c == "."))
-                high = float("".join(c for c in parts[1] if c.isdigit() or c == "."))
-                hours = (low + high) / 2
-            else:
-                hours = float("".join(c for c in estimate if c.isdigit() or c == "."))
-        except (ValueError, IndexError):
-            return 0.40  # Default moderate
-        
-        for threshold, score in cls.DURATION_THRESHOLDS:
-            if hours >= threshold:
-                return score
-        return 0.10
+    Scoring paths return full-precision floats; round once at the output
+    boundary (persisted records, printed reports), not per computation.
+    """
+    return round(value, ndigits)
 
 
 # =============================================================================
@@ -348,6 +439,18 @@ class ValenceDecay:
     MID_DECAY = 0.05
     LOW_DECAY = 0.10
     
+    # Band tables indexed by (raw >= MID) + (raw >= HIGH): 0=low, 1=mid, 2=high.
+    # log(1 - rate) per band: decay becomes exp(days × log_factor)
+    _RATE_TABLE = (LOW_DECAY, MID_DECAY, HIGH_DECAY)
+    _LOG_TABLE = tuple(math.log1p(-rate) for rate in _RATE_TABLE)
+    
+    @classmethod
+    def _log_factor(cls, raw_valence: float) -> float:
+        """log(1 - decay_rate) for the valence band of raw_valence."""
+        return cls._LOG_TABLE[
+            (raw_valence >= cls.MID_THRESHOLD) + (raw_valence >= cls.HIGH_THRESHOLD)
+        ]
+    
     @classmethod
     def compute_effective_valence(
         cls, 
@@ -358,6 +461,7 @@ class ValenceDecay:
         """Compute time-decayed effective valence.
         
         effective = raw × (1 - decay_rate) ^ days_elapsed
+                  = raw × exp(days_elapsed × log(1 - decay_rate))
         """
         if current_time is None:
             current_time = datetime.now(timezone.utc)
@@ -368,27 +472,38 @@ class ValenceDecay:
         if days <= 0:
             return raw_valence
         
-        if raw_valence >= cls.HIGH_THRESHOLD:
-            decay_rate = cls.HIGH_DECAY
-        elif raw_valence >= cls.MID_THRESHOLD:
-            decay_rate = cls.MID_DECAY
-        else:
-            decay_rate = cls.LOW_DECAY
+        effective = raw_valence * math.exp(days * cls._log_factor(raw_valence))
+        return max(0.0, effective)
+    
+    @classmethod
+    def effective_valences(
+        cls,
+        raw_valences,
+        session_epochs,
+        current_epoch: float,
+    ) -> list[float]:
+        """Batch compute_effective_valence over parallel sequences.
         
-        effective = raw_valence * math.pow(1 - decay_rate, days)
-        return round(max(0.0, effective), 3)
+        session_epochs and current_epoch are POSIX timestamps. One pass,
+        no datetime arithmetic per record.
+        """
+        high, mid = cls.HIGH_THRESHOLD, cls.MID_THRESHOLD
+        log_table = cls._LOG_TABLE
+        exp = math.exp
+        out = []
+        for raw, epoch in zip(raw_valences, session_epochs):
+            days = (current_epoch - epoch) / 86400
+            if days <= 0:
+                out.append(raw)
+                continue
+            log_factor = log_table[(raw >= mid) + (raw >= high)]
+            out.append(max(0.0, raw * exp(days * log_factor)))
+        return out
     
     @classmethod
     def half_life_days(cls, raw_valence: float) -> float:
         """How many days until this valence reaches 50% of original."""
-        if raw_valence >= cls.HIGH_THRESHOLD:
-            decay_rate = cls.HIGH_DECAY
-        elif raw_valence >= cls.MID_THRESHOLD:
-            decay_rate = cls.MID_DECAY
-        else:
-            decay_rate = cls.LOW_DECAY
-        
-        return round(-math.log(2) / math.log(1 - decay_rate), 1)
+        return -math.log(2) / cls._log_factor(raw_valence)
 
 
 # =============================================================================
@@ -430,17 +545,41 @@ class EpisodicRetrieval:
         Returns:
             Blended score (0.0 to 1.0)
         """
-        session_time = datetime.fromisoformat(record.timestamp)
-        effective_valence = ValenceDecay.compute_effective_valence(
-            record.valence, session_time, current_time
+        return cls.blended_scores([similarity], [record], current_time, valence_weight)[0]
+    
+    @classmethod
+    def blended_scores(
+        cls,
+        similarities,
+        records: list[EpisodicRecord],
+        current_time: Optional[datetime] = None,
+        valence_weight: float = DEFAULT_VALENCE_WEIGHT,
+    ) -> list[float]:
+        """Batch blended_score over parallel similarities and records.
+        
+        Decays all valences in one effective_valences pass — use this to
+        re-rank a FAISS top-K rather than calling blended_score per hit.
+        """
+        if valence_weight == 0.0:
+            # Pure semantic ranking: skip decay entirely
+            return list(similarities)
+        
+        if current_time is None:
+            current_time = datetime.now(timezone.utc)
+        
+        effective = ValenceDecay.effective_valences(
+            [r.valence for r in records],
+            [r.session_time.timestamp() for r in records],
+            current_time.timestamp(),
         )
         
         # Normalize effective valence to [0, 1] range
         # (raw valence is already [0, 1] from Phase 1 calibration)
-        normalized_valence = max(0.0, min(1.0, effective_valence))
-        
-        score = (1 - valence_weight) * similarity + valence_weight * normalized_valence
-        return round(score, 4)
+        sim_weight = 1 - valence_weight
+        return [
+            sim_weight * sim + valence_weight * max(0.0, min(1.0, eff))
+            for sim, eff in zip(similarities, effective)
+        ]
     
     @classmethod
     def rank_records(
@@ -456,16 +595,20 @@ class EpisodicRetrieval:
         if current_time is None:
             current_time = datetime.now(timezone.utc)
         
-        scored = []
-        for record in records:
-            session_time = datetime.fromisoformat(record.timestamp)
-            effective = ValenceDecay.compute_effective_valence(
-                record.valence, session_time, current_time
-            )
-            scored.append((record, effective))
-        
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored
+        effective = ValenceDecay.effective_valences(
+            [r.valence for r in records],
+            [r.session_time.timestamp() for r in records],
+            current_time.timestamp(),
+        )
+        return cls._ranked(records, effective)
+    
+    @staticmethod
+    def _ranked(
+        records: list[EpisodicRecord], effective: list[float]
+    ) -> list[tuple[EpisodicRecord, float]]:
+        """Pair records with scores, highest first (stable on ties)."""
+        order = sorted(range(len(effective)), key=effective.__getitem__, reverse=True)
+        return [(records[i], effective[i]) for i in order]
 
 
 # =============================================================================
@@ -498,14 +641,26 @@ class TrustInheritance:
         if not records:
             return TrustLevel.ESTABLISHING
         
-        max_idx = 0
-        for record in records:
-            idx = cls.TRUST_ORDER.index(record.trust_level)
-            max_idx = max(max_idx, idx)
-        
+        max_idx = max(_TRUST_IDX[record.trust_level] for record in records)
         return cls.TRUST_ORDER[max_idx]
 
 
+# Trust level → position in TRUST_ORDER (avoids list.index per record)
+_TRUST_IDX = {level: i for i, level in enumerate(TrustInheritance.TRUST_ORDER)}
+
+
+def _timestamp_epoch(timestamp: str) -> float:
+    """POSIX time of an ISO timestamp for the hot columns.
+    
+    Free-text timestamps ("late evening Feb 21") are accepted as before;
+    they index as -inf, i.e. oldest: never latest, fully decayed in ranking.
+    """
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return -math.inf
+
+
 # =============================================================================
 # Storage — JSON-based, alongside transcripts
 # =============================================================================
@@ -513,76 +668,203 @@ class TrustInheritance:
 class EpisodicStore:
     """Manages episodic records on disk.
     
-    Storage format: Single JSON file with metadata + records array.
+    Storage format: JSON snapshot with metadata + records array, plus an
+    append-only JSONL log (same path, .jsonl suffix) holding records added
+    since the last compact(). add() writes one line; compact() folds the
+    log into the snapshot. Records are materialized on first access.
+    compact() first appends a marker line whose token the snapshot records,
+    so a crash before the log is removed never replays folded records.
     Location: Alongside transcripts and session continuity documents.
     
     Phase 1 established the schema. Phase 2 adds real-time capture.
     Phase 3 (future) will integrate with Agent Zero's FAISS.
     """
     
-    SCHEMA_VERSION = "0.2.0"  # Phase 2: real-time capture
+    SCHEMA_VERSION = "0.3.0"  # Phase 2: real-time capture, pattern vocab
+    
+    # Small recurring vocabularies: dictionary-encoded in the snapshot as
+    # indices into a top-level "pattern_vocab" list ("<field>_idx" per record)
+    VOCAB_FIELDS = ("effective_patterns", "friction_patterns", "semantic_topics")
     
     def __init__(self, store_path: str | Path):
         self.path = Path(store_path)
-        self._records: list[EpisodicRecord] = []
+        self._log_path = self.path.with_suffix(".jsonl")
+        # Records load lazily: _raw holds the decoded dict until a query
+        # touches the record, then _records holds the EpisodicRecord.
+        # Exactly one of _records[i] / _raw[i] is set.
+        self._records: list[Optional[EpisodicRecord]] = []
+        self._raw: list[Optional[dict]] = []
+        self._by_id: dict[str, int] = {}
+        self._latest_idx = -1  # Max session time, kept by _index
+        # Struct-of-arrays view of the hot fields (valence, session epoch,
+        # trust index) so ranking and trust scans skip the record objects.
+        # Derived from _records; rebuilt by _load, extended by add.
+        self._valence = array("d")
+        self._epoch = array("d")
+        self._trust_idx = array("b")
+        # Trust only ever ratchets up, so keep the running max
+        self._max_trust_idx = 0
         self._load()
     
     def _load(self):
-        """Load existing records from disk."""
+        """Index snapshot records, then replay the append log.
+        
+        Only the hot fields are read here; from_dict runs on first access.
+        """
+        folded_marker = None
         if self.path.exists():
-            with open(self.path) as f:
-                data = json.load(f)
-            self._records = [
-                EpisodicRecord.from_dict(r) for r in data.get("records", [])
-            ]
-    
-    def _save(self):
-        """Write all records to disk."""
+            data = _json_loads(self.path.read_bytes())
+            folded_marker = data.get("metadata", {}).get("log_marker")
+            vocab = [sys.intern(s) for s in data.get("pattern_vocab", [])]
+            for r in data.get("records", []):
+                self._append_raw(self._decode_vocab(r, vocab))
+        if self._log_path.exists():
+            pending = []
+            with open(self._log_path, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    r = _json_loads(line)
+                    if "_compacted" in r:
+                        # compact() crashed after saving: everything up to
+                        # its marker is already in the snapshot
+                        if r["_compacted"] == folded_marker:
+                            pending.clear()
+                        continue
+                    pending.append(r)
+            for r in pending:
+                self._append_raw(self._decode_vocab(r, None))
+    
+    def _append_raw(self, d: dict) -> None:
+        """Append a not-yet-materialized record dict."""
+        # A malformed timestamp indexes as oldest rather than failing the load
+        epoch = _timestamp_epoch(d["timestamp"])
+        trust_idx = _TRUST_IDX[TrustLevel(d["trust_level"])]
+        self._records.append(None)
+        self._raw.append(d)
+        self._index(d["session_id"], d["valence"], epoch, trust_idx)
+    
+    def _append(self, record: EpisodicRecord) -> None:
+        """Append a record object."""
+        # Derive every column value before touching any list, so a bad
+        # record cannot leave the store half-updated
+        epoch = _timestamp_epoch(record.timestamp)
+        trust_idx = _TRUST_IDX[record.trust_level]
+        self._records.append(record)
+        self._raw.append(None)
+        self._index(record.session_id, record.valence, epoch, trust_idx)
+    
+    def _index(self, session_id: str, valence: float, epoch: float, trust_idx: int) -> None:
+        """Update lookup indexes and hot columns for the newest slot."""
+        i = len(self._records) - 1
+        self._by_id.setdefault(session_id, i)
+        if self._latest_idx < 0 or epoch > self._epoch[self._latest_idx]:
+            self._latest_idx = i
+        self._valence.append(valence)
+        self._epoch.append(epoch)
+        self._trust_idx.append(trust_idx)
+        if trust_idx > self._max_trust_idx:
+            self._max_trust_idx = trust_idx
+    
+    def _record(self, i: int) -> EpisodicRecord:
+        """Materialize record i on first access."""
+        record = self._records[i]
+        if record is None:
+            record = self._records[i] = EpisodicRecord.from_dict(self._raw[i])
+            self._raw[i] = None
+        return record
+    
+    @classmethod
+    def _decode_vocab(cls, d: dict, vocab: Optional[list[str]]) -> dict:
+        """Expand "<field>_idx" lists back to interned strings (in place).
+        
+        Plain string lists (pre-0.3.0 snapshots, append log lines) are
+        interned as-is.
+        """
+        for name in cls.VOCAB_FIELDS:
+            idx = d.pop(name + "_idx", None)
+            if idx is not None and vocab is not None:
+                d[name] = [vocab[i] for i in idx]
+            elif name in d:
+                d[name] = [sys.intern(s) for s in d[name]]
+        return d
+    
+    def _save(self, log_marker: Optional[str] = None):
+        """Write all records to the snapshot file (atomically)."""
+        vocab: dict[str, int] = {}
+        records = []
+        for record, raw in zip(self._records, self._raw):
+            # Untouched records serialize straight from their loaded dict
+            d = record.to_dict() if record is not None else dict(raw)
+            for name in self.VOCAB_FIELDS:
+                d[name + "_idx"] = [vocab.setdefault(s, len(vocab)) for s in d.pop(name, ())]
+            records.append(d)
         data = {
             "metadata": {
                 "schema_version": self.SCHEMA_VERSION,
                 "last_updated": datetime.now(timezone.utc).isoformat(),
                 "record_count": len(self._records),
-                "trust_level": TrustInheritance.inherit_trust(self._records).value,
+                "trust_level": self.inherited_trust.value,
+                "log_marker": log_marker,
             },
-            "records": [r.to_dict() for r in self._records],
+            "pattern_vocab": list(vocab),
+            "records": records,
         }
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "w") as f:
-            json.dump(data, f, indent=2)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_bytes(_json_dumps(data, indent=True))
+        tmp_path.replace(self.path)
     
     def add(self, record: EpisodicRecord) -> None:
-        """Add a new episodic record and persist."""
-        self._records.append(record)
-        self._save()
+        """Add a new episodic record and append it to the log."""
+        self._append(record)
+        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._log_path, "ab") as f:
+            f.write(_json_dumps(record.to_dict()) + b"\n")
+    
+    def compact(self) -> None:
+        """Fold the append log into the snapshot and truncate the log."""
+        marker = uuid.uuid4().hex
+        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._log_path, "ab") as f:
+            f.write(_json_dumps({"_compacted": marker}) + b"\n")
+        self._save(log_marker=marker)
+        self._log_path.unlink(missing_ok=True)
     
     def get_all(self) -> list[EpisodicRecord]:
         """Return all records."""
-        return list(self._records)
+        return [self._record(i) for i in range(len(self._records))]
     
     def get_by_session(self, session_id: str) -> Optional[EpisodicRecord]:
         """Find record by session ID."""
-        for r in self._records:
-            if r.session_id == session_id:
-                return r
-        return None
+        i = self._by_id.get(session_id)
+        return None if i is None else self._record(i)
     
     def get_latest(self) -> Optional[EpisodicRecord]:
         """Get the most recent record by timestamp."""
-        if not self._records:
-            return None
-        return max(self._records, key=lambda r: r.timestamp)
+        return None if self._latest_idx < 0 else self._record(self._latest_idx)
     
     def ranked_by_valence(
-        self, current_time: Optional[datetime] = None
+        self,
+        current_time: Optional[datetime] = None,
+        limit: Optional[int] = None,
     ) -> list[tuple[EpisodicRecord, float]]:
-        """Return all records ranked by effective valence."""
-        return EpisodicRetrieval.rank_records(self._records, current_time)
+        """Return records ranked by effective valence (top `limit` if given)."""
+        if current_time is None:
+            current_time = datetime.now(timezone.utc)
+        effective = ValenceDecay.effective_valences(
+            self._valence, self._epoch, current_time.timestamp()
+        )
+        if limit is None:
+            return EpisodicRetrieval._ranked(self.get_all(), effective)
+        top = heapq.nlargest(limit, range(len(effective)), key=effective.__getitem__)
+        return [(self._record(i), effective[i]) for i in top]
     
     @property
     def inherited_trust(self) -> TrustLevel:
         """Current trust level inherited from session history."""
-        return TrustInheritance.inherit_trust(self._records)
+        return TrustInheritance.TRUST_ORDER[self._max_trust_idx]
 
 
 # =============================================================================
@@ -660,7 +942,8 @@ Or estimate manually using the Phase 1 calibration:
 
 ### Storage
 
-Save the record to the episodic store alongside transcripts.
+Save the record to the episodic store alongside transcripts
+(EpisodicStore.add, then compact() at session end to refresh the snapshot).
 The next instance reads these records to understand not just what happened,
 but what the sessions were like — which ones went deep, which patterns
 worked, what the trust state is, what the collaboration's current dynamics are.
@@ -731,7 +1014,7 @@ def create_session_record(
     )
     
     if auto_compute_valence:
-        record.valence = ValenceComputer.compute(record)
+        record.valence = display_valence(ValenceComputer.compute(record))
     
     return record
 
@@ -786,7 +1069,7 @@ def validate_against_phase1():
             session_duration_estimate=dur,
             artifacts_created=["artifact"] * artifacts,
         )
-        computed = ValenceComputer.compute(record)
+        computed = display_valence(ValenceComputer.compute(record))
         delta = computed - hand_val
         deviations.append(abs(delta))
         
@@ -0,0 +1,61 @@
+"""
+Relationship traversal cap — tools/investigation_tools.py
+=========================================================
+Runs inside an Agent Zero checkout (the tools module imports
+python.helpers.tool); skipped elsewhere.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("python.helpers.tool")
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    """investigation_tools with relationships.jsonl redirected to tmp_path."""
+    monkeypatch.syspath_prepend(os.path.join(REPO_DIR, "ontology"))
+    import ontology_store
+
+    monkeypatch.setattr(ontology_store, "RELATIONSHIPS_FILE", str(tmp_path / "relationships.jsonl"))
+    spec = importlib.util.spec_from_file_location(
+        "investigation_tools", os.path.join(REPO_DIR, "tools", "investigation_tools.py"),
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module, ontology_store
+
+
+def _store_star(store, n):
+    """n relationships from ent_0 to distinct neighbours, confidence rising."""
+    for i in range(n):
+        store.store_relationship(
+            "ent_0", f"ent_{i + 1}", "related_to",
+            confidence=round(0.5 + i / (2 * n), 3), provenance={"source_id": "test"},
+        )
+
+
+def test_trimmed_final_hop_reports_capped(tools):
+    module, store = tools
+    _store_star(store, 10)
+
+    found, capped = module._traverse_relationships("ent_0", 1, 0.0, max_rels=5)
+
+    assert capped
+    assert len(found) == 5
+    # The highest-confidence relationships survive the trim
+    assert {rel["to_entity"] for _, rel in found} == {f"ent_{i}" for i in range(6, 11)}
+
+
+def test_exact_fit_is_not_capped(tools):
+    module, store = tools
+    _store_star(store, 5)
+
+    found, capped = module._traverse_relationships("ent_0", 1, 0.0, max_rels=5)
+
+    assert not capped
+    assert len(found) == 5
@@ -13,17 +13,56 @@ Tools exposed:
 All tools follow Agent-Zero's Tool/Response pattern.
 """
 
+import asyncio
+import heapq
+import importlib
 import json
 import os
 import sys
+import threading
+import weakref
 from typing import Any
 
 from python.helpers.tool import Tool, Response
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Both accept bytes
+_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+def _dump_json(obj, f) -> None:
+    """Write obj as indented JSON to binary file f (orjson when available)."""
+    if HAS_ORJSON:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        for chunk in json.JSONEncoder(indent=2).iterencode(obj):
+            f.write(chunk.encode('utf-8'))
+
 ONTOLOGY_DIR = "/a0/usr/ontology"
 CONFIG_PATH = os.path.join(ONTOLOGY_DIR, "ontology_config.json")
 INVESTIGATIONS_DIR = os.path.join(ONTOLOGY_DIR, "investigations")
 
+# Shared default for missing relationship sub-dicts; never mutated
+_EMPTY: dict = {}
+
+# Max concurrent ontology store calls (search/store) per event loop; a
+# malformed ONT_STORE_CONCURRENCY falls back to the default
+DEFAULT_STORE_CONCURRENCY = 8
+try:
+    STORE_CONCURRENCY = max(1, int(os.getenv('ONT_STORE_CONCURRENCY') or DEFAULT_STORE_CONCURRENCY))
+except ValueError:
+    print(
+        f"[ONT-INVEST] Invalid ONT_STORE_CONCURRENCY={os.getenv('ONT_STORE_CONCURRENCY')!r}, "
+        f"using {DEFAULT_STORE_CONCURRENCY}",
+        flush=True,
+    )
+    STORE_CONCURRENCY = DEFAULT_STORE_CONCURRENCY
+
 
 # ════════════════════════════════════════════════════════════════════════════
 # Tool 1: ontology_search
@@ -48,12 +87,13 @@ class OntologySearch(Tool):
         try:
             _ensure_ontology_path()
             from ontology_store import search_entities
-            docs = await search_entities(
-                self.agent, query,
-                entity_type=entity_type,
-                limit=int(limit),
-                threshold=float(threshold),
-            )
+            async with _store_sem():
+                docs = await search_entities(
+                    self.agent, query,
+                    entity_type=entity_type,
+                    limit=int(limit),
+                    threshold=float(threshold),
+                )
 
             if not docs:
                 return Response(
@@ -61,26 +101,18 @@ class OntologySearch(Tool):
                     break_loop=False,
                 )
 
-            results = []
+            # search_entities only returns docs that carry metadata
+            parts = [f"Found {len(docs)} ontology entities:\n\n"]
             for doc in docs:
-                ont = doc.metadata.get('ontology', {}) if hasattr(doc, 'metadata') else {}
-                props = ont.get('properties', {})
-                entry = {
-                    "entity_id": ont.get('entity_id', ''),
-                    "entity_type": ont.get('entity_type', 'entity'),
-                    "name": props.get('name', ''),
-                    "summary": getattr(doc, 'page_content', '')[:200],
-                    "sources": len(ont.get('provenance_chain', [])),
-                }
-                results.append(entry)
-
-            text = f"Found {len(results)} ontology entities:\n\n"
-            for r in results:
-                text += f"**{r['name']}** ({r['entity_type']}, id: {r['entity_id']})\n"
-                text += f"  {r['summary']}\n"
-                text += f"  Sources: {r['sources']}\n\n"
+                ont = doc.metadata.get('ontology', {})
+                parts.append(
+                    f"**{ont.get('properties', {}).get('name', '')}** "
+                    f"({ont.get('entity_type', 'entity')}, id: {ont.get('entity_id', '')})\n"
+                    f"  {doc.page_content[:200]}\n"
+                    f"  Sources: {len(ont.get('provenance_chain', []))}\n\n"
+                )
 
-            return Response(message=text, break_loop=False)
+            return Response(message="".join(parts), break_loop=False)
 
         except Exception as e:
             return Response(message=f"Ontology search error: {e}", break_loop=False)
@@ -90,6 +122,34 @@ class OntologySearch(Tool):
 # Tool 2: source_ingest
 # ════════════════════════════════════════════════════════════════════════════
 
+# connector_type → connector kind
+_CONNECTOR_KINDS = {
+    'csv': 'csv', 'tsv': 'csv',
+    'json': 'json', 'jsonl': 'json',
+    'html': 'html', 'text': 'html', 'txt': 'html',
+}
+_SUPPORTED_CONNECTORS = ", ".join(_CONNECTOR_KINDS)
+
+# connector kind → (module, ingest function); imported on first use
+_CONNECTORS = {
+    'csv': ('connectors.csv_connector', 'ingest_csv'),
+    'json': ('connectors.json_connector', 'ingest_json'),
+    'html': ('connectors.html_connector', 'ingest_html_file'),
+}
+_CONNECTOR_FUNCS: dict = {}
+
+
+def _get_connector(kind: str):
+    """Resolve a connector's ingest function, importing its module once."""
+    func = _CONNECTOR_FUNCS.get(kind)
+    if func is None:
+        _ensure_ontology_path()
+        module_name, func_name = _CONNECTORS[kind]
+        func = getattr(importlib.import_module(module_name), func_name)
+        _CONNECTOR_FUNCS[kind] = func
+    return func
+
+
 class SourceIngest(Tool):
     """Ingest a data file into the ontology via the appropriate connector."""
 
@@ -115,35 +175,28 @@ class SourceIngest(Tool):
             )
 
         try:
-            _ensure_ontology_path()
-            connector_type = connector_type.lower().strip()
-
-            if connector_type in ('csv', 'tsv'):
-                from connectors.csv_connector import ingest_csv
-                result = ingest_csv(
-                    file_path, source_id,
-                    entity_type=entity_type,
-                    force_reingest=force_reingest,
+            kind = _CONNECTOR_KINDS.get(connector_type)
+            if kind is None:
+                # Normalize only when the exact spelling misses
+                connector_type = connector_type.lower().strip()
+                kind = _CONNECTOR_KINDS.get(connector_type)
+            if kind is None:
+                return Response(
+                    message=f"Unknown connector type: {connector_type}. "
+                            f"Supported: {_SUPPORTED_CONNECTORS}",
+                    break_loop=False,
                 )
-            elif connector_type in ('json', 'jsonl'):
-                from connectors.json_connector import ingest_json
-                result = ingest_json(
+
+            ingest = _get_connector(kind)
+            if kind == 'html':
+                is_html = connector_type == 'html'
+                result = ingest(file_path, source_id, is_html=is_html)
+            else:
+                result = ingest(
                     file_path, source_id,
                     entity_type=entity_type,
                     force_reingest=force_reingest,
                 )
-            elif connector_type in ('html', 'text', 'txt'):
-                from connectors.html_connector import ingest_html
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                is_html = connector_type == 'html'
-                result = ingest_html(content, source_id, is_html=is_html)
-            else:
-                return Response(
-                    message=f"Unknown connector type: {connector_type}. "
-                            f"Supported: csv, tsv, json, jsonl, html, text",
-                    break_loop=False,
-                )
 
             n_candidates = len(result.get('candidates', []))
             skipped = result.get('skipped', 0)
@@ -182,9 +235,9 @@ class EntityResolve(Tool):
             _ensure_ontology_path()
             from resolution_engine import (
                 read_ingestion_queue, resolve_batch, mark_queue_resolved,
-                load_resolution_config, _candidate_id,
+                load_resolution_config,
             )
-            from ontology_store import store_entity
+            from ontology_store import store_entities_bulk
 
             config = load_resolution_config()
             candidates = read_ingestion_queue(limit=int(max_candidates))
@@ -207,36 +260,29 @@ class EntityResolve(Tool):
             distinct = result.get('distinct', [])
             flagged = result.get('flagged', [])
 
-            # Store resolved entities in FAISS
-            stored = 0
-            for entity in resolved + distinct:
-                try:
-                    eid = await store_entity(self.agent, entity)
-                    if eid:
-                        stored += 1
-                except Exception as e:
-                    print(f"[ONT-INVEST] Store error: {e}", flush=True)
+            # Store resolved entities in FAISS (one batched insert)
+            async with _store_sem():
+                stored = len(await store_entities_bulk(self.agent, resolved + distinct))
 
             # Mark processed candidates as resolved
-            candidate_ids = {_candidate_id(c) for c in candidates}
-            mark_queue_resolved(candidate_ids)
+            mark_queue_resolved(result['candidate_ids'])
 
-            text = (
+            parts = [
                 f"Entity resolution complete:\n"
                 f"  - {len(candidates)} candidates processed\n"
                 f"  - {len(resolved)} entities merged (auto-resolved)\n"
                 f"  - {len(distinct)} entities created as distinct\n"
                 f"  - {len(flagged)} ambiguous pairs flagged for review\n"
                 f"  - {stored} entities stored in ontology\n\n"
-            )
+            ]
 
             if flagged:
-                text += (
+                parts.append(
                     f"Review queue has {len(flagged)} entries. "
                     f"Use relationship_query to explore ambiguous matches."
                 )
 
-            return Response(message=text, break_loop=False)
+            return Response(message="".join(parts), break_loop=False)
 
         except Exception as e:
             return Response(message=f"Resolution error: {e}", break_loop=False)
@@ -273,12 +319,13 @@ class RelationshipQuery(Tool):
         try:
             _ensure_ontology_path()
             from ontology_store import (
-                get_entity_relationships, get_entity_by_id, search_entities,
+                get_entity_by_id, search_entities,
             )
 
             # Resolve entity_id from name if needed
             if not entity_id and entity_name:
-                docs = await search_entities(self.agent, entity_name, limit=1, threshold=0.5)
+                async with _store_sem():
+                    docs = await search_entities(self.agent, entity_name, limit=1, threshold=0.5)
                 if docs:
                     ont = docs[0].metadata.get('ontology', {})
                     entity_id = ont.get('entity_id', '')
@@ -290,30 +337,12 @@ class RelationshipQuery(Tool):
                 )
 
             # Traverse hops
-            visited = {entity_id}
-            frontier = [entity_id]
-            all_rels = []
-            hop_labels = {}
-
-            for hop in range(int(hops)):
-                next_frontier = []
-                for eid in frontier:
-                    rels = get_entity_relationships(
-                        eid,
-                        rel_type=relationship_type,
-                        direction="both",
-                    )
-                    for rel in rels:
-                        if rel.get('confidence', 0) < float(min_confidence):
-                            continue
-                        all_rels.append({**rel, "_hop": hop + 1})
-                        for connected_id in (rel.get('from_entity'), rel.get('to_entity')):
-                            if connected_id and connected_id not in visited:
-                                visited.add(connected_id)
-                                next_frontier.append(connected_id)
-                frontier = next_frontier
-                if not frontier:
-                    break
+            # (hop, rel) pairs; rel dicts are shared with the cache, not copied
+            max_rels = _traversal_cap()
+            all_rels, capped = _traverse_relationships(
+                entity_id, hops, float(min_confidence), relationship_type,
+                max_rels=max_rels,
+            )
 
             if not all_rels:
                 return Response(
@@ -322,24 +351,26 @@ class RelationshipQuery(Tool):
                 )
 
             # Format output
-            text = f"Relationships for entity {entity_id}:\n\n"
-            for rel in all_rels[:30]:
+            parts = [f"Relationships for entity {entity_id}:\n\n"]
+            for hop, rel in all_rels[:30]:
                 from_name = rel.get('from_entity_name', rel.get('from_entity', ''))
                 to_name = rel.get('to_entity_name', rel.get('to_entity', ''))
                 rel_type = rel.get('type', 'related_to')
                 conf = rel.get('confidence', 0)
-                hop = rel.get('_hop', 1)
-                props = rel.get('properties', {})
+                props = rel.get('properties') or _EMPTY
 
-                text += (
+                parts.append(
                     f"  [{hop}-hop] {from_name} --[{rel_type}]--> {to_name}"
                     f" (confidence: {conf:.2f})\n"
                 )
                 if props.get('role'):
-                    text += f"    Role: {props['role']}\n"
+                    parts.append(f"    Role: {props['role']}\n")
 
-            text += f"\nTotal: {len(all_rels)} relationships across {hops} hop(s)\n"
-            return Response(message=text, break_loop=False)
+            parts.append(f"\nTotal: {len(all_rels)} relationships across {hops} hop(s)")
+            if capped:
+                parts.append(f" ({_cap_note(max_rels)})")
+            parts.append("\n")
+            return Response(message="".join(parts), break_loop=False)
 
         except Exception as e:
             return Response(message=f"Relationship query error: {e}", break_loop=False)
@@ -374,21 +405,22 @@ class InvestigationReport(Tool):
 
         try:
             _ensure_ontology_path()
-            from ontology_store import search_entities, get_entity_relationships
+            from ontology_store import search_entities
 
             # If investigation_id given, load saved investigation
             inv_file = os.path.join(INVESTIGATIONS_DIR, f"{investigation_id}.json")
             if investigation_id and os.path.isfile(inv_file):
-                with open(inv_file, 'r', encoding='utf-8') as f:
-                    investigation = json.load(f)
+                with open(inv_file, 'rb') as f:
+                    investigation = _loads(f.read())
                 target_entity = investigation.get('target_entity', target_entity)
 
             # Search for target entity
             target_docs = []
             if target_entity:
-                target_docs = await search_entities(
-                    self.agent, target_entity, limit=3, threshold=0.4,
-                )
+                async with _store_sem():
+                    target_docs = await search_entities(
+                        self.agent, target_entity, limit=3, threshold=0.4,
+                    )
 
             if not target_docs:
                 return Response(
@@ -400,8 +432,26 @@ class InvestigationReport(Tool):
                 )
 
             # Build evidence chain
+            min_conf = float(min_confidence)
             findings = []
-            for doc in target_docs[:3]:
+            # Relationship provenance, stored once per dict object and
+            # referenced from findings by index
+            provenance_table = []
+            provenance_ids = {}
+
+            # Independent BFS per target, run concurrently off the event loop
+            targets = target_docs[:3]
+            max_rels = _traversal_cap()
+            traversals = await asyncio.gather(*(
+                asyncio.to_thread(
+                    _traverse_relationships,
+                    doc.metadata.get('ontology', {}).get('entity_id', ''),
+                    depth, min_conf, None, max_rels,
+                )
+                for doc in targets
+            ))
+
+            for doc, (traversal, capped) in zip(targets, traversals):
                 ont = doc.metadata.get('ontology', {})
                 entity_id = ont.get('entity_id', '')
                 entity_name = ont.get('properties', {}).get('name', '')
@@ -415,42 +465,31 @@ class InvestigationReport(Tool):
                     "confidence": min((p.get('confidence', 0.5) for p in provenance), default=0.5),
                     "relationships": [],
                     "evidence_chain": [],
+                    # Cap that truncated the traversal, if one did
+                    "capped_at": max_rels if capped else None,
                 }
 
-                # Get relationships (multi-hop)
-                visited = {entity_id}
-                frontier = [entity_id]
-                for hop in range(int(depth)):
-                    next_frontier = []
-                    for eid in frontier:
-                        rels = get_entity_relationships(eid, direction="both")
-                        for rel in rels:
-                            conf = rel.get('confidence', 0)
-                            if conf < float(min_confidence):
-                                continue
-                            entity_finding['relationships'].append(rel)
-
-                            # Build evidence chain entry
-                            from_name = rel.get('from_entity_name', rel.get('from_entity', ''))
-                            to_name = rel.get('to_entity_name', rel.get('to_entity', ''))
-                            rel_type = rel.get('type', 'related_to')
-                            prov = rel.get('provenance', {})
-
-                            entity_finding['evidence_chain'].append({
-                                "finding": f"{from_name} {rel_type} {to_name}",
-                                "confidence": conf,
-                                "source": prov.get('source_id', 'unknown'),
-                                "hop": hop + 1,
-                            })
-
-                            for connected in (rel.get('from_entity'), rel.get('to_entity')):
-                                if connected and connected not in visited:
-                                    visited.add(connected)
-                                    next_frontier.append(connected)
-
-                    frontier = next_frontier
-                    if not frontier:
-                        break
+                for hop, rel in traversal:
+                    prov = rel.get('provenance') or _EMPTY
+                    # Cached rel dicts are shared, so identity finds repeats
+                    # (the table keeps every prov alive, so ids stay unique)
+                    prov_id = provenance_ids.get(id(prov))
+                    if prov_id is None:
+                        prov_id = provenance_ids[id(prov)] = len(provenance_table)
+                        provenance_table.append(prov)
+                    entity_finding['relationships'].append(_project_relationship(rel, prov_id))
+
+                    # Build evidence chain entry
+                    from_name = rel.get('from_entity_name', rel.get('from_entity', ''))
+                    to_name = rel.get('to_entity_name', rel.get('to_entity', ''))
+                    rel_type = rel.get('type', 'related_to')
+
+                    entity_finding['evidence_chain'].append({
+                        "finding": f"{from_name} {rel_type} {to_name}",
+                        "confidence": rel.get('confidence', 0),
+                        "source": prov.get('source_id', 'unknown'),
+                        "hop": hop,
+                    })
 
                 findings.append(entity_finding)
 
@@ -463,8 +502,14 @@ class InvestigationReport(Tool):
             os.makedirs(INVESTIGATIONS_DIR, exist_ok=True)
             report_id = investigation_id or target_entity.replace(' ', '_').lower()[:30]
             report_file = os.path.join(INVESTIGATIONS_DIR, f"{report_id}_report.json")
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump({"target": target_entity, "findings": findings, "report": report}, f, indent=2)
+            payload = {
+                "target": target_entity,
+                "findings": findings,
+                "provenance": provenance_table,
+                "report": report,
+            }
+            with open(report_file, 'wb') as f:
+                _dump_json(payload, f)
 
             return Response(message=report, break_loop=False)
 
@@ -472,6 +517,20 @@ class InvestigationReport(Tool):
             return Response(message=f"Report generation error: {e}", break_loop=False)
 
 
+def _project_relationship(rel: dict, provenance_id: int) -> dict:
+    """Subset of a relationship kept in report findings."""
+    return {
+        "rel_id": rel.get('rel_id', ''),
+        "type": rel.get('type', ''),
+        "from_entity": rel.get('from_entity', ''),
+        "from_entity_name": rel.get('from_entity_name', rel.get('from_entity', '')),
+        "to_entity": rel.get('to_entity', ''),
+        "to_entity_name": rel.get('to_entity_name', rel.get('to_entity', '')),
+        "confidence": rel.get('confidence', 0),
+        "provenance_id": provenance_id,
+    }
+
+
 def _format_report(
     target: str, findings: list, inv_id: str, depth: int, min_conf: float,
 ) -> str:
@@ -502,25 +561,30 @@ def _format_report(
         lines.append("")
 
         if relationships:
-            lines.append(f"### Relationships ({len(relationships)} found)")
-            for rel in relationships[:15]:
-                from_n = rel.get('from_entity_name', rel.get('from_entity', ''))
-                to_n = rel.get('to_entity_name', rel.get('to_entity', ''))
-                rel_type = rel.get('type', '')
-                conf = rel.get('confidence', 0)
-                lines.append(f"- {from_n} --[{rel_type}]--> {to_n} (conf: {conf:.2f})")
+            cap = finding.get('capped_at')
+            note = f", {_cap_note(cap)}" if cap else ""
+            lines.append(f"### Relationships ({len(relationships)} found{note})")
+            # Projected rows (_project_relationship) carry every key
+            rows = [
+                (r['from_entity_name'], r['to_entity_name'], r['type'], r['confidence'])
+                for r in relationships[:15]
+            ]
+            lines.extend(
+                f"- {from_n} --[{rel_type}]--> {to_n} (conf: {conf:.2f})"
+                for from_n, to_n, rel_type, conf in rows
+            )
             lines.append("")
 
         if evidence:
             lines.append("### Evidence Chain")
-            for e in evidence[:10]:
-                chain_conf = e.get('confidence', 0)
-                source = e.get('source', 'unknown')
-                hop = e.get('hop', 1)
-                lines.append(
-                    f"- [hop {hop}] {e['finding']} "
-                    f"(source: {source}, conf: {chain_conf:.2f})"
-                )
+            rows = [
+                (e['hop'], e['finding'], e['source'], e['confidence'])
+                for e in evidence[:10]
+            ]
+            lines.extend(
+                f"- [hop {hop}] {text} (source: {source}, conf: {conf:.2f})"
+                for hop, text, source, conf in rows
+            )
             lines.append("")
 
     if not findings:
@@ -529,11 +593,163 @@ def _format_report(
     return "\n".join(lines)
 
 
+# ── Relationship Traversal ────────────────────────────────────────────────────
+
+# (entity_id, rel_type) → _rel_columns(relationships), shared by
+# relationship_query and investigation_report across calls. The columns are
+# extracted once per fetch so the BFS filters and expands on tuples of
+# floats and ids, not dict gets.
+# Dropped whenever relationships.jsonl changes (mtime/size) or the cache
+# outgrows _REL_CACHE_MAX. Traversals run in worker threads, so cache access
+# is locked; file scans happen outside the lock.
+_REL_CACHE: dict = {}
+_REL_CACHE_STAMP = None
+_REL_CACHE_MAX = 4096
+_REL_CACHE_LOCK = threading.Lock()
+
+# Default cap on relationships per traversal; overridden by
+# investigation.max_relationships_per_traversal in ontology_config.json
+MAX_TRAVERSED_RELS = 500
+
+
+def _rel_columns(rels: list) -> tuple:
+    """(rels, confidences, from_ids, to_ids) as parallel tuples."""
+    return (
+        rels,
+        tuple(float(rel.get('confidence', 0)) for rel in rels),
+        tuple(rel.get('from_entity') for rel in rels),
+        tuple(rel.get('to_entity') for rel in rels),
+    )
+
+
+def _cached_relationships(entity_ids: list, rel_type: str = None) -> dict:
+    """_rel_columns per entity, fetching only cache misses."""
+    global _REL_CACHE_STAMP
+    from ontology_store import RELATIONSHIPS_FILE, get_entity_relationships_bulk
+
+    try:
+        st = os.stat(RELATIONSHIPS_FILE)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    with _REL_CACHE_LOCK:
+        if stamp != _REL_CACHE_STAMP or len(_REL_CACHE) > _REL_CACHE_MAX:
+            _REL_CACHE.clear()
+            _REL_CACHE_STAMP = stamp
+        found = {
+            eid: _REL_CACHE[(eid, rel_type)]
+            for eid in entity_ids if (eid, rel_type) in _REL_CACHE
+        }
+
+    missing = [eid for eid in entity_ids if eid not in found]
+    if missing:
+        fetched = get_entity_relationships_bulk(missing, rel_type=rel_type, direction="both")
+        for eid, rels in fetched.items():
+            found[eid] = _rel_columns(rels)
+        with _REL_CACHE_LOCK:
+            if stamp == _REL_CACHE_STAMP:
+                for eid in missing:
+                    _REL_CACHE[(eid, rel_type)] = found[eid]
+    return found
+
+
+def _traverse_relationships(
+    start_id: str, hops: int, min_confidence: float, rel_type: str = None,
+    max_rels: int = MAX_TRAVERSED_RELS,
+) -> tuple:
+    """Breadth-first relationship expansion from start_id.
+
+    Returns ([(hop, rel), ...], capped): pairs in discovery order (hop is
+    1-based) for relationships with confidence >= min_confidence, which the
+    caller casts to float once. rel dicts come from the shared cache — copy
+    before mutating.
+
+    At most max_rels relationships are returned. The hop that crosses the
+    cap keeps its highest-confidence relationships (ties by discovery
+    order) and expansion stops there; capped is then True.
+    """
+    visited = {start_id}
+    frontier = [start_id]
+    found = []
+    hops = int(hops)
+
+    for hop in range(1, hops + 1):
+        # One relationships.jsonl scan per hop at most, not per entity
+        rels_by_eid = _cached_relationships(frontier, rel_type)
+        level = []
+        for eid in frontier:
+            rels, confidences, from_ids, to_ids = rels_by_eid[eid]
+            level.extend(
+                row for row in zip(confidences, rels, from_ids, to_ids)
+                if row[0] >= min_confidence
+            )
+
+        room = max_rels - len(found)
+        trimmed = len(level) > room
+        if trimmed:
+            keep = heapq.nlargest(room, range(len(level)), key=lambda i: level[i][0])
+            level = [level[i] for i in sorted(keep)]
+        found.extend((hop, row[1]) for row in level)
+        if len(found) >= max_rels:
+            # Truncated if this hop was trimmed or hops remain unexplored
+            return found, trimmed or hop < hops
+
+        next_frontier = []
+        for _, _, from_id, to_id in level:
+            for connected_id in (from_id, to_id):
+                if connected_id and connected_id not in visited:
+                    visited.add(connected_id)
+                    next_frontier.append(connected_id)
+        frontier = next_frontier
+        if not frontier:
+            break
+
+    return found, False
+
+
+def _cap_note(max_rels: int) -> str:
+    """Output note for a traversal truncated at max_rels."""
+    return f"capped at {max_rels}; raise investigation.max_relationships_per_traversal"
+
+
 # ── Utilities ─────────────────────────────────────────────────────────────────
 
+_ONTOLOGY_PATHS = (ONTOLOGY_DIR, os.path.join(ONTOLOGY_DIR, "connectors"))
+_PATH_INSTALLED = False
+
+
 def _ensure_ontology_path():
-    """Add ontology directory to sys.path for module imports."""
-    ontology_connectors = os.path.join(ONTOLOGY_DIR, "connectors")
-    for path in (ONTOLOGY_DIR, ontology_connectors):
+    """Add ontology directory to sys.path for module imports (once)."""
+    global _PATH_INSTALLED
+    if _PATH_INSTALLED:
+        return
+    for path in _ONTOLOGY_PATHS:
         if path not in sys.path:
             sys.path.insert(0, path)
+    _PATH_INSTALLED = True
+
+
+# One semaphore per event loop: asyncio primitives are loop-bound, and
+# each agent context may run its own loop
+_STORE_SEMS = weakref.WeakKeyDictionary()
+
+
+def _store_sem() -> asyncio.Semaphore:
+    """Semaphore bounding ontology store calls on the running loop."""
+    loop = asyncio.get_running_loop()
+    sem = _STORE_SEMS.get(loop)
+    if sem is None:
+        sem = _STORE_SEMS[loop] = asyncio.Semaphore(STORE_CONCURRENCY)
+    return sem
+
+
+def _traversal_cap() -> int:
+    """investigation.max_relationships_per_traversal from the ontology config."""
+    try:
+        with open(CONFIG_PATH, 'rb') as f:
+            cfg = _loads(f.read())
+        return int(cfg.get('investigation', {}).get(
+            'max_relationships_per_traversal', MAX_TRAVERSED_RELS,
+        ))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return MAX_TRAVERSED_RELS